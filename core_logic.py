@@ -14,9 +14,9 @@
 - 关键操作支援回滚
 - 异常信息记录完整的上下文
 """
+import errno
 import os
 import shutil
-import threading
 import sys
 import platform
 try:
@@ -26,7 +26,10 @@ except ImportError:
 import re
 import stat
 import json
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Callable, Any
 
@@ -36,6 +39,45 @@ from logger import get_logger
 
 log = get_logger(__name__)
 
+# 安装複製阶段每隔多少个文件才考虑推送一次进度（上限；文件较少时按总数缩小，见 install_from_library）
+_PROGRESS_BATCH = 64
+
+# os.copy_file_range 仅在 Linux（Python 3.8+）可用
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+# copy_file_range 因跨文件系统或不支援而失败时，回退到常规複製
+_COPY_FALLBACK_ERRNOS = frozenset(
+    code for code in (
+        getattr(errno, "EXDEV", None),
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "ENOSYS", None),
+        getattr(errno, "EINVAL", None),
+        getattr(errno, "EBADF", None),
+    ) if code is not None
+)
+
+# 支援以目录句柄 (dir_fd) 相对打开文件的平台（POSIX）
+_SUPPORTS_DIR_FD = hasattr(os, "O_DIRECTORY") and os.open in os.supports_dir_fd
+
+# 广度扫描时匹配的游戏目录名：
+# - ^...$: 完整匹配文件夹名
+# - War 与 Thunder 之间允许：空白(\s)、下划线(_)、横线(-) 或什么都没有
+# - re.IGNORECASE: 忽略大小写
+_WT_DIR_PATTERN = re.compile(r'^War[\s\-_]*Thunder$', re.IGNORECASE)
+
+# Steam libraryfolders.vdf 中的库路径条目
+_VDF_PATH_PATTERN = re.compile(r'"path"\s+"([^"]+)"')
+
+# config.blk 中的 sound{ 块起始（不区分大小写）
+_SOUND_BLOCK_PATTERN = re.compile(r'(sound\s*\{)', re.IGNORECASE)
+
+# 广度扫描时跳过的系统目录
+_SCAN_EXCLUDE_DIRS = frozenset({
+    "Windows", "ProgramData", "Recycle.Bin", "System Volume Information",
+    "Documents and Settings", "AppData"
+})
+
 
 class CoreServiceError(Exception):
     """CoreService 相关错误的基类。"""
@@ -68,8 +110,20 @@ class CoreService:
     def __init__(self):
         """初始化 CoreService 实例。"""
         self.game_root: Path | None = None
-        # 安装清单管理器在 validate_game_path 校验通过后初始化
-        self.manifest_mgr: ManifestManager | None = None
+        # 安装清单管理器在校验通过后首次访问 manifest_mgr 时才初始化
+        self._manifest_mgr: ManifestManager | None = None
+        # 区分「尚未加载」与「因无游戏路径/初始化失败而为 None」
+        self._manifest_initialized = False
+        # sound/mod 目录的解析结果，在 validate_game_path 校验通过后缓存
+        self._mod_dir_resolved: Path | None = None
+        self._mod_dir_resolved_str: str = ""
+        # 最近一次校验通过的 (路径, 目录 mtime_ns)；目录未变化时再次校验直接命中
+        self._validated_key: tuple[str, int] | None = None
+        # 已解析的安装清单缓存，以 (清单路径, mtime_ns) 判定是否失效
+        self._mods_cache: dict | None = None
+        self._mods_cache_key: tuple[str, int] | None = None
+        # 搜索与安装共用的后台线程池，统一限制并发
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="core")
 
     def validate_game_path(self, path_str: str) -> tuple[bool, str]:
         """
@@ -85,6 +139,16 @@ class CoreService:
             log.warning("游戏路径校验失败: 路径为空")
             return False, "路径为空"
         
+        # 同一路径且目录 mtime 未变（config.blk 未被增删）时复用上次的校验结果，
+        # 也不重置已加载的清单管理器
+        try:
+            key = (str(path_str), os.stat(path_str).st_mtime_ns)
+        except OSError:
+            key = None
+        if key is not None and key == self._validated_key and self.game_root is not None:
+            return True, "校验通过"
+        self._validated_key = None
+        
         path = Path(path_str)
         
         if not path.exists():
@@ -101,38 +165,94 @@ class CoreService:
             return False, "缺少 config.blk"
         
         self.game_root = path
-        # 初始化安装清单管理器（用于记录本次安装文件与冲突检测）
+        # 缓存解析后的 sound/mod 路径，供删除前的边界校验複用
         try:
-            self.manifest_mgr = ManifestManager(self.game_root)
-            log.info(f"游戏路径校验成功: {path}")
-        except Exception as e:
-            log.error(f"初始化清单管理器失败: {e}")
-            # 清单管理器失败不阻止继续操作
+            self._mod_dir_resolved = (path / "sound" / "mod").resolve()
+            self._mod_dir_resolved_str = str(self._mod_dir_resolved)
+        except OSError as e:
+            log.debug(f"解析 mod 目录失败: {e}")
+            self._mod_dir_resolved = None
+            self._mod_dir_resolved_str = ""
+        # 安装清单管理器延迟到首次使用时再加载
+        self._manifest_mgr = None
+        self._manifest_initialized = False
+        self._validated_key = key
+        log.info(f"游戏路径校验成功: {path}")
         
         return True, "校验通过"
 
-    def start_search_thread(self, callback: Callable[[str | None], None]) -> None:
+    @property
+    def manifest_mgr(self) -> ManifestManager | None:
+        """
+        安装清单管理器（用于记录本次安装文件与冲突检测），首次访问时加载清单文件。
+        
+        Returns:
+            ManifestManager 实例；未设置游戏路径或初始化失败时返回 None
         """
-        以后台线程执行 auto_detect_game_path，并在完成后回调返回结果。
+        if not self._manifest_initialized and self.game_root:
+            self._manifest_initialized = True
+            try:
+                self._manifest_mgr = ManifestManager(self.game_root)
+            except Exception as e:
+                log.error(f"初始化清单管理器失败: {e}")
+                # 清单管理器失败不阻止继续操作
+                self._manifest_mgr = None
+        return self._manifest_mgr
+
+    def start_search_thread(
+        self,
+        callback: Callable[[str | None], None] | None = None,
+        cancel_event: threading.Event | None = None
+    ) -> Future:
+        """
+        在后台线程池执行 auto_detect_game_path，并在完成后回调返回结果。
         
         Args:
             callback: 搜索完成后的回调函数，参数为找到的路径或 None
+            cancel_event: 置位后中止全盘扫描（例如窗口关闭时）
+            
+        Returns:
+            搜索任务的 Future
         """
-        def run():
+        def _done(fut: Future) -> None:
             try:
-                path = self.auto_detect_game_path()
-                if callback:
-                    callback(path)
+                path = fut.result()
             except Exception as e:
                 log.error(f"自动搜索游戏路径线程异常: {e}")
-                if callback:
-                    callback(None)
+                path = None
+            if callback:
+                callback(path)
+
+        fut = self._executor.submit(self.auto_detect_game_path, cancel_event)
+        fut.add_done_callback(_done)
+        return fut
+
+    def start_install_task(
+        self,
+        source_mod_path: Path,
+        install_list: List[str] | None = None,
+        progress_callback: Callable[[int, str], None] | None = None
+    ) -> Future:
+        """
+        在后台线程池执行 install_from_library。
+        
+        Args:
+            source_mod_path: 语音包源目录路径
+            install_list: 待安装的文件夹相对路径列表
+            progress_callback: 进度回调函数 (百分比, 讯息)
+            
+        Returns:
+            安装任务的 Future，结果为 install_from_library 的返回值
+        """
+        return self._executor.submit(
+            self.install_from_library, source_mod_path, install_list, progress_callback
+        )
 
-        t = threading.Thread(target=run, name="GamePathSearch")
-        t.daemon = True
-        t.start()
+    def shutdown(self) -> None:
+        """释放后台线程池（不等待进行中的任务）。"""
+        self._executor.shutdown(wait=False)
 
-    def get_windows_game_paths(self) -> str | None:
+    def get_windows_game_paths(self, cancel_event: threading.Event | None = None) -> str | None:
         """
         在本机上自动定位 War Thunder 安装目录。
         支持 Windows
@@ -142,6 +262,9 @@ class CoreService:
         2. 常见默认路径
         3. 全盘/用户目录扫描
         
+        Args:
+            cancel_event: 置位后中止全盘扫描
+        
         Returns:
             找到的游戏路径，未找到则返回 None
         """
@@ -162,6 +285,13 @@ class CoreService:
                 if self._check_is_wt_dir(p):
                     log.info(f"[FOUND] 通过注册表找到路径: {p}")
                     return str(p)
+
+                # 遍历 libraryfolders.vdf 中登记的所有 Steam 库
+                for lib in self._read_steam_library_paths(steam_path):
+                    p = Path(lib) / "steamapps" / "common" / "War Thunder"
+                    if self._check_is_wt_dir(p):
+                        log.info(f"[FOUND] 通过 Steam 库清单找到路径: {p}")
+                        return str(p)
             except Exception as e:
                 log.debug(f"读取 Steam 注册表失败/跳过: {e}")
 
@@ -200,51 +330,62 @@ class CoreService:
                 log.info(f"[FOUND] 常见路径检测命中: {path}")
                 return str(path)
 
-        # 3. 广度扫描 (使用 re 匹配)
+        # 3. 广度扫描 (限定深度的 BFS)
         log.info("[SEARCH] 进入广度扫描模式...")
-        # 优化匹配模式：
-        # - ^...$: 完整匹配文件夹名
-        # - War 与 Thunder 之间允许：空白(\s)、下划线(_)、横线(-) 或什么都没有
-        # - re.IGNORECASE: 忽略大小写
-        wt_pattern = re.compile(r'^War[\s\-_]*Thunder$', re.IGNORECASE)
+        for root_dir in accessible_drives:
+            log.info(f"正在扫描目录: {root_dir}")
+            found = self._bfs_find_wt(root_dir, cancel_event=cancel_event)
+            if found:
+                log.info(f"[FOUND] 扫描找到路径: {found}")
+                return str(found)
+            if cancel_event is not None and cancel_event.is_set():
+                log.info("[SEARCH] 扫描已取消")
+                return None
         
-        search_roots = []
-        exclude_dirs = set()
+        log.warning("[FAIL] 未自动找到游戏路径。")
+        return None
 
-        drives = [f"{c}:\\" for c in "CDEFGHIJK"]
-        search_roots = [d for d in drives if os.path.exists(d)]
-        exclude_dirs = {
-            "Windows", "ProgramData", "Recycle.Bin", "System Volume Information", 
-            "Documents and Settings", "AppData"
-        }
-
-        for root_dir in search_roots:
-            if not os.path.exists(root_dir):
-                continue
+    def _bfs_find_wt(self, root: str, max_depth: int = 4, cancel_event: threading.Event | None = None) -> str | None:
+        """
+        从 root 开始按层级广度优先搜索 War Thunder 目录，命中即返回。
+        
+        使用 os.scandir 的 DirEntry 缓存判断目录类型，避免额外的 stat 调用；
+        仅对名称匹配的目录执行 config.blk 校验。
+        
+        Args:
+            root: 搜索起点（通常为驱动器根目录）
+            max_depth: 最大搜索深度
+            cancel_event: 每进入一个目录前检查，置位后立即返回 None
             
-            log.info(f"正在扫描目录: {root_dir}")
+        Returns:
+            找到的游戏目录路径，未找到则返回 None
+        """
+        queue = deque([(root, 0)])
+        while queue:
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            cur, depth = queue.popleft()
             try:
-                for root, dirs, _ in os.walk(root_dir):
-                    # 剪枝：移除不需要扫描的目录
-                    # Windows 下排除以 $ 开头的系统隐藏目录
-                    dirs[:] = [
-                        d for d in dirs 
-                        if d not in exclude_dirs 
-                        and not d.startswith('$')
-                    ]
-                    
-                    for d in dirs:
-                        if wt_pattern.match(d):
-                            full_path = Path(root) / d
+                with os.scandir(cur) as it:
+                    for entry in it:
+                        name = entry.name
+                        # 剪枝：排除系统目录与以 $ 开头的系统隐藏目录
+                        if name in _SCAN_EXCLUDE_DIRS or name.startswith('$'):
+                            continue
+                        try:
+                            if not entry.is_dir(follow_symlinks=False):
+                                continue
+                        except OSError:
+                            continue
+                        if _WT_DIR_PATTERN.match(name):
                             # 二次确认是有效的游戏目录
-                            if self._check_is_wt_dir(full_path):
-                                log.info(f"[FOUND] 扫描找到路径: {full_path}")
-                                return str(full_path)
-            except Exception as e:
-                log.debug(f"扫描目录 {root_dir} 异常: {e}")
+                            if os.path.isfile(os.path.join(entry.path, "config.blk")):
+                                return entry.path
+                        if depth < max_depth:
+                            queue.append((entry.path, depth + 1))
+            except OSError as e:
+                log.debug(f"扫描目录 {cur} 异常: {e}")
                 continue
-        
-        log.warning("[FAIL] 未自动找到游戏路径。")
         return None
 
     def get_linux_game_paths(self):
@@ -273,16 +414,7 @@ class CoreService:
         
         for root in [r for r in steam_roots if r.exists()]:
             paths.add(str(root)) # 添加根目录本身作为备选
-            vdf_path = root / "config" / "libraryfolders.vdf"
-            if vdf_path.exists():
-                try:
-                    with open(vdf_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        # 提取所有库路径
-                        found = re.findall(r'"path"\s+"([^"]+)"', content)
-                        paths.update(found)
-                except Exception as e:
-                    log.warning(f"解析 VDF 失败: {e}")
+            paths.update(self._read_steam_library_paths(root))
 
         # 2. 验证路径
         for base_path in paths:
@@ -293,19 +425,47 @@ class CoreService:
                 
         return None
 
-    def auto_detect_game_path(self):
+    def _read_steam_library_paths(self, steam_root: Path) -> list[str]:
+        """
+        解析 <steam_root>/config/libraryfolders.vdf，返回其中登记的所有 Steam 库路径。
+        
+        Args:
+            steam_root: Steam 安装根目录
+            
+        Returns:
+            库路径列表，文件不存在或解析失败时返回空列表
+        """
+        vdf_path = Path(steam_root) / "config" / "libraryfolders.vdf"
+        try:
+            with open(vdf_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            log.warning(f"解析 VDF 失败: {e}")
+            return []
+        # VDF 中的反斜杠被转义为 \\，还原为实际路径
+        return [p.replace("\\\\", "\\") for p in _VDF_PATH_PATTERN.findall(content)]
+
+    def auto_detect_game_path(self, cancel_event: threading.Event | None = None):
         """
         功能定位:
         - 在本机上自动定位 War Thunder 安装目录(跨平台支持)。
 
         输入输出:
-        - 参数: 无
+        - 参数:
+          - cancel_event: 可选，置位后中止全盘扫描并返回 None。
         - 返回:
           - str | None，找到则返回游戏根目录路径字符串，否则返回 None。
         """
 
+        # 已校验的游戏目录仍然有效时直接返回，免去一次完整扫描
+        if self.game_root and os.path.isfile(os.path.join(str(self.game_root), "config.blk")):
+            log.info(f"[FOUND] 当前游戏路径仍然有效: {self.game_root}")
+            return str(self.game_root)
+
         if sys.platform == "win32":
-            return self.get_windows_game_paths()
+            return self.get_windows_game_paths(cancel_event)
         elif sys.platform == "linux":
             return self.get_linux_game_paths()
 
@@ -325,65 +485,6 @@ class CoreService:
         except Exception:
             return False
 
-    def _is_safe_deletion_path(self, target_path: Path) -> bool:
-        """
-        校验待删除路径是否位于 <game_root>/sound/mod 目录内部，避免越界删除。
-        
-        Args:
-            target_path: 待检查的路径
-            
-        Returns:
-            是否为安全的删除路径
-        """
-        if not self.game_root:
-            return False
-        try:
-            mod_dir = (self.game_root / "sound" / "mod").resolve()
-            tp = Path(target_path).resolve()
-            common = os.path.commonpath([str(tp), str(mod_dir)])
-            return common == str(mod_dir) and str(tp) != str(mod_dir)
-        except ValueError:
-            # commonpath 在路径不在同一驱动器时会抛出 ValueError
-            return False
-        except Exception as e:
-            log.debug(f"路径安全检查异常: {e}")
-            return False
-
-    def _remove_path(self, path_obj: Path) -> None:
-        """
-        删除文件或目录（包含只读文件的处理），用于清理 sound/mod 下的子项。
-        
-        Args:
-            path_obj: 待删除的路径
-            
-        Raises:
-            PermissionError: 权限不足
-            OSError: 其他文件系统错误
-        """
-        p = Path(path_obj)
-        
-        def _handle_readonly(func, path, exc_info):
-            """处理只读文件的错误回调。"""
-            try:
-                os.chmod(path, stat.S_IWRITE)
-                func(path)
-            except Exception as e:
-                log.warning(f"处理只读文件失败: {path} - {e}")
-                raise
-        
-        try:
-            if p.is_file() or p.is_symlink():
-                try:
-                    p.unlink()
-                except PermissionError:
-                    os.chmod(p, stat.S_IWRITE)
-                    p.unlink()
-            elif p.is_dir():
-                shutil.rmtree(p, onerror=_handle_readonly)
-        except Exception as e:
-            log.error(f"删除路径失败: {p} - {type(e).__name__}: {e}")
-            raise
-
     def get_installed_mods(self) -> List[str]:
         """
         获取已安装的 mod 列表。
@@ -397,11 +498,19 @@ class CoreService:
         
         try:
             manifest_file = self.manifest_mgr.manifest_file
-            if not manifest_file.exists():
+            try:
+                cache_key = (str(manifest_file), os.stat(manifest_file).st_mtime_ns)
+            except FileNotFoundError:
                 return []
             
-            with open(manifest_file, "r", encoding="utf-8") as f:
-                _mods = json.load(f)
+            # 清单文件未变更时直接使用内存中的解析结果
+            if self._mods_cache is not None and self._mods_cache_key == cache_key:
+                _mods = self._mods_cache
+            else:
+                with open(manifest_file, "r", encoding="utf-8") as f:
+                    _mods = json.load(f)
+                self._mods_cache = _mods
+                self._mods_cache_key = cache_key
             
             _installed_mods = _mods.get("installed_mods", {})
             if not _installed_mods:
@@ -514,37 +623,57 @@ class CoreService:
             # 进度计算：10% 预检，15-95% 複製文件，95-100% 更新配置
             copy_progress_start = 15
             copy_progress_end = 95
+            progress_step = (copy_progress_end - copy_progress_start) / total_files_to_copy
+            last_idx = len(files_info) - 1
+            # 文件数按总数缩放：几十个大 .bank 文件的语音包也能逐个推送进度，仅由时间节流限制频率
+            progress_batch = min(_PROGRESS_BATCH, max(1, total_files_to_copy // 100))
+            last_progress_idx = -1
             last_progress_update = time.monotonic()
 
-            for idx, (src_file, dest_file, folder_rel_path) in enumerate(files_info):
+            # POSIX 下打开一次 mod 目录句柄，目标文件均相对该句柄打开
+            mod_dir_fd = None
+            if _SUPPORTS_DIR_FD:
                 try:
-                    shutil.copy2(src_file, dest_file)
-                    total_files += 1
-                    installed_files_record.append(dest_file.name)
-
-                    # 统计每个文件夹的文件数
-                    if folder_rel_path not in folder_files_count:
-                        folder_files_count[folder_rel_path] = 0
-                    folder_files_count[folder_rel_path] += 1
-
-                    # 更新进度 (限制更新频率，避免 UI 卡顿)
-                    now = time.monotonic()
-                    if progress_callback and (now - last_progress_update >= 0.1 or idx == len(files_info) - 1):
-                        progress = copy_progress_start + (idx + 1) / total_files_to_copy * (
-                                copy_progress_end - copy_progress_start)
-                        # 文件名截断显示
-                        fname = src_file.name
-                        if len(fname) > 20:
-                            fname = fname[:17] + "..."
-                        progress_callback(int(progress), f"複製: {fname}")
-                        last_progress_update = now
-
-                except PermissionError as e:
-                    log.warning(f"複製文件 {src_file.name} 失败（权限不足）: {e}")
+                    mod_dir_fd = os.open(game_mod_dir, os.O_RDONLY | os.O_DIRECTORY)
                 except OSError as e:
-                    log.warning(f"複製文件 {src_file.name} 失败: {e}")
-                except Exception as e:
-                    log.warning(f"複製文件 {src_file.name} 失败: {type(e).__name__}: {e}")
+                    log.debug(f"打开 mod 目录句柄失败，改用完整路径: {e}")
+
+            try:
+                for idx, (src_file, dest_file, folder_rel_path) in enumerate(files_info):
+                    try:
+                        self._clone_or_copy(src_file, dest_file, dir_fd=mod_dir_fd)
+                        total_files += 1
+                        installed_files_record.append(dest_file.name)
+
+                        # 统计每个文件夹的文件数
+                        if folder_rel_path not in folder_files_count:
+                            folder_files_count[folder_rel_path] = 0
+                        folder_files_count[folder_rel_path] += 1
+
+                        # 更新进度 (按文件数与时间双重节流，避免 UI 卡顿)
+                        if progress_callback and (
+                            idx == last_idx or idx - last_progress_idx >= progress_batch
+                        ):
+                            now = time.monotonic()
+                            if idx == last_idx or now - last_progress_update >= 0.05:
+                                progress = copy_progress_start + (idx + 1) * progress_step
+                                # 文件名截断显示
+                                fname = src_file.name
+                                if len(fname) > 20:
+                                    fname = fname[:17] + "..."
+                                progress_callback(int(progress), f"複製: {fname}")
+                                last_progress_update = now
+                                last_progress_idx = idx
+
+                    except PermissionError as e:
+                        log.warning(f"複製文件 {src_file.name} 失败（权限不足）: {e}")
+                    except OSError as e:
+                        log.warning(f"複製文件 {src_file.name} 失败: {e}")
+                    except Exception as e:
+                        log.warning(f"複製文件 {src_file.name} 失败: {type(e).__name__}: {e}")
+            finally:
+                if mod_dir_fd is not None:
+                    os.close(mod_dir_fd)
 
             # 输出每个文件夹的统计
             for folder_path, count in folder_files_count.items():
@@ -582,6 +711,68 @@ class CoreService:
                 progress_callback(100, "安装失败")
             return False
 
+    def _clone_or_copy(self, src: Path, dst: Path, dir_fd: int | None = None) -> None:
+        """
+        複製单个文件并保留权限与时间戳（等价于 shutil.copy2）。
+        
+        Linux 下优先使用 os.copy_file_range，由内核完成複製；
+        在支援 reflink 的文件系统（btrfs/XFS 等）上只需建立区块引用而不搬运数据。
+        提供 dir_fd 时，目标文件以相对目录句柄的方式打开，省去每个文件的完整路径解析。
+        
+        Args:
+            src: 源文件路径
+            dst: 目标文件路径（提供 dir_fd 时仅使用文件名）
+            dir_fd: 目标目录的文件描述符（仅 POSIX）
+            
+        Raises:
+            OSError: 複製失败
+        """
+        if dir_fd is None and not _HAS_COPY_FILE_RANGE:
+            shutil.copy2(src, dst)
+            return
+
+        with open(src, 'rb') as fsrc:
+            st = os.fstat(fsrc.fileno())
+            if dir_fd is not None:
+                fd = os.open(dst.name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+                fdst = os.fdopen(fd, 'wb')
+            else:
+                fdst = open(dst, 'wb')
+            with fdst:
+                self._copy_file_contents(fsrc, fdst, st.st_size)
+                fdst.flush()
+                # 与 shutil.copy2 一致：保留权限位与访问/修改时间
+                os.chmod(fdst.fileno(), stat.S_IMODE(st.st_mode))
+                os.utime(fdst.fileno(), ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    def _copy_file_contents(self, fsrc, fdst, size: int) -> None:
+        """
+        将 fsrc 的内容写入 fdst：优先 os.copy_file_range，不支援时回退到 1MB 缓冲的 copyfileobj。
+        
+        Args:
+            fsrc: 以二进制读模式打开的源文件
+            fdst: 以二进制写模式打开的目标文件
+            size: 源文件大小
+        """
+        if _HAS_COPY_FILE_RANGE:
+            try:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+                # 从头改用常规複製
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, length=1024 * 1024)
+
     def restore_game(self) -> bool:
         """
         将游戏目录恢復为未加载语音包的状态。
@@ -604,19 +795,32 @@ class CoreService:
             
             if mod_dir.exists():
                 log.info("[CLEAN] 正在清空 mod 文件夹内容...")
-                # 遍历并删除文件夹内的所有内容，但不删除文件夹本身
-                for item in mod_dir.iterdir():
+                # 边界校验：仅当 mod_dir 确为 <game_root>/sound/mod 本身（非符号链接）时才整体删除
+                try:
+                    is_expected_dir = (
+                        not mod_dir.is_symlink()
+                        and self._mod_dir_resolved is not None
+                        and mod_dir.resolve() == self._mod_dir_resolved
+                    )
+                except OSError:
+                    is_expected_dir = False
+                if not is_expected_dir:
+                    log.warning(f"🚫 [安全拦截] 拒绝清空非预期的 mod 目录: {mod_dir}")
+                else:
+                    def _handle_readonly(func, path, exc_info):
+                        """处理只读文件的错误回调：去除只读属性后重试。"""
+                        try:
+                            os.chmod(path, stat.S_IWRITE)
+                            func(path)
+                        except Exception as e:
+                            log.warning(f"无法删除 {os.path.basename(path)}: {e}")
+
+                    # 整体删除后重建目录，避免逐项 stat/resolve
+                    shutil.rmtree(mod_dir, onerror=_handle_readonly)
                     try:
-                        # 删除前进行边界校验，确保删除目标位于 sound/mod 目录内部
-                        if not self._is_safe_deletion_path(item):
-                            log.warning(f"🚫 [安全拦截] 拒绝删除保护文件: {item}")
-                            continue
-
-                        self._remove_path(item)
-                    except PermissionError as e:
-                        log.warning(f"无法删除 {item.name}（权限不足）: {e}")
+                        mod_dir.mkdir(parents=True, exist_ok=True)
                     except OSError as e:
-                        log.warning(f"无法删除 {item.name}: {e}")
+                        log.warning(f"重建 mod 目录失败: {e}")
             
             # 清空安装清单记录
             if self.manifest_mgr:
@@ -641,7 +845,7 @@ class CoreService:
         """
         在 <game_root>/config.blk 中启用 enable_mod:b=yes。
         
-        必要时创建备份并在失败时回滚。
+        写入采用临时文件 + 原子替换，失败时以内存中的原内容回滚。
         
         Returns:
             是否更新成功
@@ -650,7 +854,7 @@ class CoreService:
         backup = self.game_root / "config.blk.backup"
         
         try:
-            # 创建备份文件（用于写入失败或校验失败时回滚）
+            # 创建备份文件（供用户手动恢复原始配置）
             if config.exists():
                 try:
                     shutil.copy2(config, backup)
@@ -687,7 +891,7 @@ class CoreService:
         # 若未出现 enable_mod 字段，则在 sound{...} 块起始处插入 enable_mod:b=yes
         else:
             # 匹配 sound { 或 sound{，不区分大小写
-            pattern = re.compile(r'(sound\s*\{)', re.IGNORECASE)
+            pattern = _SOUND_BLOCK_PATTERN
             if pattern.search(content):
                 # 在 sound{ 后面插入换行和 enable_mod:b=yes
                 new_content = pattern.sub(r'\1\n  enable_mod:b=yes', content, count=1)
@@ -698,53 +902,45 @@ class CoreService:
 
         if new_content != content:
             try:
-                with open(config, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
+                # 写临时文件后原子替换：要么完整写入，要么原文件保持不变（失败时无需回滚）
+                self._write_config_atomic(config, new_content)
                 log.info("[SUCCESS] 配置文件已更新 (Config Updated)")
-                
-                # 写入后读取并校验结果
-                with open(config, 'r', encoding='utf-8', errors='ignore') as f:
-                    verify_content = f.read()
-                    
-                if "enable_mod:b=yes" in verify_content:
-                    log.info("[SUCCESS] 验证成功：Mod 权限已激活 [OK]")
-                    return True
-                else:
-                    log.error("验证失败：虽然写入成功但未检测到激活项，请检查文件是否被只读或被锁定！")
-                    # 校验失败时尝试回滚到备份内容
-                    self._rollback_config(backup, config)
-                    return False
-
+                return True
             except PermissionError as e:
                 log.error(f"写入配置文件失败（权限不足）: {e}")
                 log.warning("提示：请检查 config.blk 是否被设置为[只读]，或者游戏是否正在运行导致文件被佔用。")
-                self._rollback_config(backup, config)
                 return False
             except OSError as e:
                 log.error(f"写入配置文件失败: {e}")
-                self._rollback_config(backup, config)
                 return False
             except Exception as e:
                 log.error(f"写入配置文件失败: {type(e).__name__}: {e}")
-                self._rollback_config(backup, config)
                 return False
         
         return True
 
-    def _rollback_config(self, backup: Path, config: Path) -> None:
+    def _write_config_atomic(self, config: Path, text: str) -> None:
         """
-        回滚配置文件到备份版本。
+        先写入同目录临时文件，再通过 os.replace 原子替换 config。
         
         Args:
-            backup: 备份文件路径
             config: 配置文件路径
+            text: 待写入的完整内容
+            
+        Raises:
+            OSError: 写入或替换失败（失败时清理临时文件，原文件保持不变）
         """
-        if backup.exists():
+        temp_file = config.with_name(config.name + ".tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_file, config)
+        except Exception:
             try:
-                shutil.copy2(backup, config)
-                log.warning("已自动回滚配置文件")
-            except Exception as restore_error:
-                log.error(f"回滚失败: {restore_error}")
+                temp_file.unlink()
+            except OSError:
+                pass
+            raise
 
     def _disable_config_mod(self) -> bool:
         """
@@ -14,16 +14,33 @@
 - 文件操作使用具体的异常类型
 - 所有操作记录完整的错误上下文
 """
+import codecs
+import errno
+import locale
 import os
+import struct
 import sys
 import platform
 import shutil
 import subprocess
 import time
 import zipfile
+import zlib
 import json
+import logging
 import re
-from collections import Counter
+import threading
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+from collections import Counter, deque
+from contextlib import nullcontext
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from typing import Callable, Any
 from logger import get_logger
@@ -35,6 +52,142 @@ log = get_logger(__name__)
 DIR_PENDING = "WT待解压区"
 DIR_LIBRARY = "WT语音包库"
 
+# 运行平台（导入时确定一次）
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_MAC = _SYSTEM == "Darwin"
+
+# 禁止操作的系统根目录/关键目录（小写、去除末尾分隔符）
+_FORBIDDEN_ROOTS = frozenset(
+    r.rstrip("/\\") for r in (
+        "c:\\", "c:\\windows", "c:\\program files", "c:\\program files (x86)", "c:\\users",
+        "/", "/bin", "/boot", "/dev", "/etc", "/home", "/lib", "/lib64", "/media", "/mnt", "/opt",
+        "/proc", "/root", "/run", "/sbin", "/srv", "/sys", "/tmp", "/usr", "/var",
+    )
+)
+
+# ZIP 并行解压：成员数达到阈值才启用，线程数上限
+_PARALLEL_EXTRACT_MIN_FILES = 16
+# 成员数不足阈值时，单个成员达到该大小 (8MB) 视为大文件，多个大文件同样并行解压
+_PARALLEL_EXTRACT_BIG_MEMBER = 8 * 1024 * 1024
+_PARALLEL_EXTRACT_MAX_WORKERS = 4
+# 批量导入时同时解压的压缩包数量上限
+_BATCH_IMPORT_MAX_WORKERS = 4
+
+# 语音包文件夹类型，按优先级排序（陆战 > 无线电 > 空战 > 默认）
+_FOLDER_TYPES = ("ground", "radio", "aircraft", "folder")
+
+# .bank 文件名分类（调用方传入小写文件名），单次匹配即可区分陆战/无线电/空战：
+#   [_]crew_dialogs_ground[_<国家缩写>].assets.bank -> ground
+#   [_]crew_dialogs_common[_<国家缩写>].assets.bank -> common
+#   aircraft_gui.assets.bank / aircraft_guns.assets.bank -> gui / guns
+_BANK_RE = re.compile(
+    r'^_?(?:crew_dialogs_(?:(?P<ground>ground)|(?P<common>common))(?:_[a-z0-9]+)?'
+    r'|aircraft_(?:(?P<gui>gui)|(?P<guns>guns)))\.assets\.bank$'
+)
+_CHAT_BANK_RE = re.compile(r'dialogs_chat_[a-z0-9]+\.bank$')
+
+# 降噪包 / 导弹音效对应的 .bank 文件名（小写）
+_NOISE_NAMES = frozenset({
+    "crew_dialogs_common.assets.bank",
+    "crew_dialogs_common.bank",
+    "crew_dialogs_ground.assets.bank",
+    "crew_dialogs_ground.bank",
+    "crew_dialogs_naval.assets.bank",
+    "crew_dialogs_naval.bank",
+    "masterbank.assets.bank",
+    "masterbank.bank",
+})
+_MISSILE_NAMES = frozenset({
+    "aircraft_common.assets.bank",
+    "aircraft_effects.assets.bank",
+    "aircraft_guns.assets.bank",
+    "aircraft_guns.bank",
+})
+
+# _classify_bank_tags 可推断的标签总数 (noise/pilot/tank/radio/air/missile/music)
+_ALL_TAGS_COUNT = 7
+
+# tags -> 前端使用的 capabilities 键
+_CAPABILITY_MAP = {
+    "tank": "tank", "陆战": "tank", "ground": "tank",
+    "air": "air", "空战": "air", "aircraft": "air",
+    "naval": "naval", "海战": "naval",
+    "radio": "radio", "无线电": "radio", "无线电/局势": "radio",
+    "status": "status", "局势播报": "radio",
+    "missile": "missile", "导弹音效": "missile",
+    "music": "music", "音乐包": "music",
+    "noise": "noise", "降噪包": "noise",
+    "pilot": "pilot", "飞行员语音": "pilot"
+}
+
+# 国家缩写：2-10 个小写字母
+_COUNTRY_CODE_RE = re.compile(r"^[a-z]{2,10}$")
+
+# _BANK_RE 分组 -> 文件夹类型优先级 (_FOLDER_TYPES 下标)
+_FOLDER_RANKS = {"ground": 0, "common": 1, "gui": 2, "guns": 2}
+# _BANK_RE 分组 -> 推断标签（aircraft_guns 归入导弹音效，由名单判断）
+_BANK_KIND_TAGS = {"ground": "tank", "common": "radio", "gui": "air"}
+
+# 解压时的读写缓冲大小 (1MB)
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# 不超过该大小 (4MB) 的成员一次性读入内存后整块写出
+_SMALL_MEMBER_SIZE = 4 * 1024 * 1024
+
+# 解压进度节流：每写入该字节数才检查一次时间间隔 (4MB)
+_PROGRESS_CHECK_BYTES = 4 * 1024 * 1024
+
+# 未压缩成员由内核直接複製 (Linux copy_file_range)，每次调用的最大字节数 (16MB)
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range") and hasattr(os, "pread")
+_STORED_COPY_CHUNK = 16 * 1024 * 1024
+_COPY_FALLBACK_ERRNOS = frozenset(
+    code for code in (
+        getattr(errno, "EXDEV", None),
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "ENOSYS", None),
+        getattr(errno, "EINVAL", None),
+        getattr(errno, "EBADF", None),
+    ) if code is not None
+)
+
+# 语音包扫描结果（大小/文件夹/标签）的持久化缓存文件，位于语音包库根目录
+_SCAN_CACHE_NAME = ".size.cache"
+
+# 磁盘可用空间快照的有效期（秒），连续导入时复用同一快照
+_DISK_CACHE_TTL = 1.0
+
+# 已核对 ZipExtFile 私有属性 (_expected_crc / _decompressor) 语义的 Python 版本范围；
+# 超出范围时不做调整，按 zipfile 的公开行为解压（校验 CRC、使用标准 zlib）
+_ZIPEXTFILE_TUNABLE = (3, 8) <= sys.version_info[:2] <= (3, 14)
+
+# Linux 下提示内核对压缩包做顺序预读
+_HAS_FADVISE = hasattr(os, "posix_fadvise") and hasattr(os, "POSIX_FADV_SEQUENTIAL")
+# Linux 下为大文件预先分配磁盘空间，写入时不再逐块扩展文件
+_HAS_FALLOCATE = sys.platform.startswith("linux") and hasattr(os, "posix_fallocate")
+
+# 7z -bsp1 进度输出中的百分比
+_7Z_PERCENT_RE = re.compile(r"(\d{1,3})%")
+# 7z 进度片段（以退格覆盖的 "45% 3 - file"），返回输出文本前移除
+_7Z_PROGRESS_FRAGMENT_RE = re.compile(r" *\d{1,3}%[^\x08\r\n]*\x08+")
+# 7z 输出中表示需要密码/密码错误的关键字（小写）
+_7Z_PASSWORD_HINTS = ("password", "incorrect", "encrypted")
+# 7z 输出保留的末尾字符数
+_7Z_OUTPUT_TAIL_CHARS = 16 * 1024
+# 7z 输出的行分隔（含进度片段使用的退格），用于逐行匹配密码关键字
+_7Z_LINE_SPLIT_RE = re.compile(r"[\r\n\x08]+")
+# 额外保留的密码相关行数上限（文件名中含关键字时也不会无限增长）
+_7Z_HINT_LINES_MAX = 32
+
+# ZIP 文件名编码：通用标志位 bit 11 表示文件名为 UTF-8；否则按下列顺序尝试
+_ZIP_FLAG_UTF8 = 0x800
+_ZIP_NAME_CODECS = ("utf-8", "gbk", "cp950")
+
+# ZIP 本地文件头: 固定部分长度，以及文件名/扩展字段长度 (位于偏移 26)
+_ZIP_LOCAL_HEADER_SIZE = 30
+_ZIP_LOCAL_HEADER_SIG = b"PK\x03\x04"
+
 
 # 定义压缩包相关异常类
 class ArchiveError(Exception):
@@ -67,6 +220,19 @@ class DiskSpaceError(Exception):
     pass
 
 
+class _ProgressWriter:
+    """包装目标文件对象：每次写入后以写入字节数调用 on_chunk，用于 copyfileobj 期间统计进度。"""
+
+    def __init__(self, target, on_chunk: Callable[[int], None]):
+        self._target = target
+        self._on_chunk = on_chunk
+
+    def write(self, data) -> int:
+        n = self._target.write(data)
+        self._on_chunk(len(data))
+        return n
+
+
 class LibraryManager:
     """
     语音包库管理器：管理待解压区与语音包库的文件操作。
@@ -103,6 +269,23 @@ class LibraryManager:
             self.library_dir = Path(library_dir)
         else:
             self.library_dir = self.root_dir / DIR_LIBRARY
+
+        # 语音包详情缓存: mod_name -> (目录 st_mtime_ns, details)
+        self._details_cache: dict[str, tuple[int, dict[str, Any]]] = {}
+        # 详情缓存的写入/清理锁：前端的多个 API 调用在不同线程上并行执行 get_mod_details 与清理
+        self._details_cache_lock = threading.Lock()
+        # 目录扫描结果的持久化缓存 (语音包库/.size.cache)，首次使用时加载
+        self._scan_cache: dict[str, dict[str, Any]] | None = None
+        self._scan_cache_lock = threading.Lock()
+        # 内存中的扫描缓存有未写盘的改动；由 _flush_scan_cache 在一轮扫描结束后统一写入
+        self._scan_cache_dirty = False
+        # 并行解压时串行化密码输入，避免多个密码对话框同时弹出
+        self._password_lock = threading.Lock()
+        # 磁盘可用空间快照: 盘符 -> (查询时间, 剩余字节)，导入时按估算大小扣减
+        self._disk_cache: dict[str, tuple[float, int]] = {}
+        self._disk_cache_lock = threading.Lock()
+        # 解析符号链接后的目录路径，供 _is_safe_path 比较
+        self._refresh_abs_dirs()
         
         # 确保目录存在
         self._ensure_dirs()
@@ -146,6 +329,7 @@ class LibraryManager:
                         log.error(f"无法创建待解压区目录: {e}")
                         return result
                 self.pending_dir = new_path
+                self._refresh_abs_dirs()
                 result['pending_updated'] = True
                 log.info(f"待解压区路径已更新: {new_path}")
         
@@ -167,11 +351,20 @@ class LibraryManager:
                         log.error(f"无法创建语音包库目录: {e}")
                         return result
                 self.library_dir = new_path
+                with self._details_cache_lock:
+                    self._details_cache.clear()
+                self._scan_cache = None
+                self._refresh_abs_dirs()
                 result['library_updated'] = True
                 log.info(f"语音包库路径已更新: {new_path}")
         
         return result
 
+    def _refresh_abs_dirs(self) -> None:
+        """缓存待解压区与语音包库解析后的绝对路径，路径变更时调用。"""
+        self._abs_pending_dir = os.path.realpath(self.pending_dir)
+        self._abs_library_dir = os.path.realpath(self.library_dir)
+
     def get_current_paths(self) -> dict[str, str]:
         """
         返回当前的待解压区和语音包库路径。
@@ -196,13 +389,34 @@ class LibraryManager:
         Returns:
             解析后的字典，失败则返回 None
         """
-        encodings = ["utf-8-sig", "utf-8", "cp950", "big5", "gbk"]
+        # 只读取一次文件，之后在内存中按 BOM / 编码回退解析
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            log.warning(f"无法读取 JSON 文件 {file_path}: {e}")
+            return None
+
+        if data.startswith(b"\xef\xbb\xbf"):
+            data = data[3:]
+            encodings = ["utf-8"]
+        elif data.startswith((b"\xff\xfe", b"\xfe\xff")):
+            encodings = ["utf-16"]
+        else:
+            encodings = ["utf-8", "cp950", "big5", "gbk"]
         last_error = None
+
+        # 已安装 orjson 时直接解析 UTF-8 字节；失败再走编码回退
+        if orjson is not None and encodings[0] == "utf-8":
+            try:
+                return orjson.loads(data)
+            except ValueError as e:
+                last_error = e
+                encodings = encodings[1:]
         
         for enc in encodings:
             try:
-                with open(file_path, "r", encoding=enc) as f:
-                    return json.load(f)
+                return json.loads(data.decode(enc))
             except UnicodeDecodeError:
                 continue
             except json.JSONDecodeError as e:
@@ -238,6 +452,8 @@ class LibraryManager:
             level: 日誌级别
         """
         tag = str(level or "INFO").upper()
+        if tag not in {"WARN", "WARNING", "ERROR"} and not log.isEnabledFor(logging.INFO):
+            return
         msg = str(message)
 
         # 统一前缀：避免重複叠加
@@ -261,11 +477,10 @@ class LibraryManager:
         """
         try:
             path_str = str(path)
-            system = platform.system()
             
-            if system == "Windows":
+            if _IS_WINDOWS:
                 os.startfile(path_str)
-            elif system == "Darwin":  # macOS
+            elif _IS_MAC:  # macOS
                 subprocess.Popen(["open", path_str])
             else:  # Linux
                 subprocess.Popen(["xdg-open", path_str])
@@ -303,6 +518,43 @@ class LibraryManager:
             log.error(f"扫描语音包库失败: {type(e).__name__}: {e}")
         return mods
 
+    def scan_library_with_details(self) -> dict[str, dict[str, Any]]:
+        """
+        扫描语音包库并并行读取每个语音包的详情。
+        
+        各语音包目录相互独立，目录遍历主要耗时在系统调用上（期间释放 GIL），
+        因此使用线程池并行执行 get_mod_details；未变化的语音包直接命中详情缓存。
+        
+        Returns:
+            语音包名称 -> 详情字典，顺序与 scan_library 一致
+        """
+        mods = self.scan_library()
+        self._prune_detail_caches(mods)
+        workers = min(len(mods), os.cpu_count() or 1)
+        try:
+            if workers <= 1:
+                return {mod: self.get_mod_details(mod) for mod in mods}
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mod-scan") as ex:
+                return dict(zip(mods, ex.map(self.get_mod_details, mods)))
+        finally:
+            # 本轮所有缓存未命中的结果只写盘一次
+            self._flush_scan_cache()
+
+    def _prune_detail_caches(self, mods):
+        # 移除已不在语音包库中的语音包对应的详情缓存与 .size.cache 条目（删除/改名后残留）。
+        live = set(mods)
+        with self._details_cache_lock:
+            for name in [n for n in self._details_cache if n not in live]:
+                del self._details_cache[name]
+        with self._scan_cache_lock:
+            if not self._scan_cache:
+                return
+            stale = [n for n in self._scan_cache if n not in live]
+            if stale:
+                for name in stale:
+                    del self._scan_cache[name]
+                self._scan_cache_dirty = True
+
     def scan_pending(self) -> list[Path]:
         """
         扫描待解压区中的 ZIP/RAR 文件列表。
@@ -322,7 +574,7 @@ class LibraryManager:
             log.error(f"扫描待解压区失败: {type(e).__name__}: {e}")
         return archives
 
-    def _normalize_wtlive_compat_files(self, mod_dir: Path) -> None:
+    def _normalize_wtlive_compat_files(self, mod_dir: Path, deep_search: bool = False) -> None:
         """
         规范化语音包目录中的元数据与封面文件命名。
         
@@ -330,45 +582,36 @@ class LibraryManager:
         
         Args:
             mod_dir: 语音包目录路径
+            deep_search: 根目录与 info 目录均未找到时，是否递归搜索整个目录树；
+                仅在导入刚解压完成时启用（目录项仍在系统缓存中）
         """
         try:
             mod_dir = Path(mod_dir)
-            if not mod_dir.exists() or not mod_dir.is_dir():
+            if not os.path.isdir(mod_dir):
                 return
 
             info_dir = mod_dir / "info"
+            # 根目录只列举一次：常见情况下 info.json 与封面都已就位，无需任何额外的 stat/glob
+            root_files = self._list_file_names(mod_dir)
 
             info_json_path = mod_dir / "info.json"
-            if not info_json_path.exists():
+            if "info.json" not in root_files:
                 info_sources = []
                 for d in [mod_dir, info_dir]:
-                    if not d.exists() or not d.is_dir():
-                        continue
-
-                    cand = d / "info.bank"
-                    if cand.exists() and cand.is_file():
-                        info_sources.append(cand)
-
-                    try:
-                        for f in d.iterdir():
-                            if not f.is_file():
-                                continue
-                            if f.suffix.lower() != ".bank":
-                                continue
-                            if "aimerwt" in f.name.lower():
-                                info_sources.append(f)
-                    except PermissionError:
-                        log.debug(f"无法访问目录: {d}")
-                    except Exception:
-                        pass
+                    # 文件名只转小写一次，以 endswith 判断扩展名，不创建 Path 对象
+                    files = root_files if d is mod_dir else self._list_file_names(d)
+                    if "info.bank" in files:
+                        info_sources.append(Path(files["info.bank"]))
+                    for low, path in files.items():
+                        if low.endswith(".bank") and "aimerwt" in low:
+                            info_sources.append(Path(path))
                         
-                if not info_sources:
+                if not info_sources and deep_search:
                     try:
-                        for f in mod_dir.rglob("*.bank"):
-                            if not f.is_file():
-                                continue
-                            if "aimerwt" in f.name.lower():
-                                info_sources.append(f)
+                        for entry, _, _ in self._iter_files_scandir(mod_dir):
+                            name = entry.name.lower()
+                            if name.endswith(".bank") and "aimerwt" in name:
+                                info_sources.append(Path(entry.path))
                                 break
                     except Exception:
                         pass
@@ -376,14 +619,14 @@ class LibraryManager:
                 src = next((p for p in info_sources if p.exists()), None)
                 if src:
                     try:
-                        shutil.move(str(src), str(info_json_path))
+                        os.replace(src, info_json_path)
                         log.debug(f"已重命名 {src.name} -> info.json")
                     except PermissionError as e:
                         log.warning(f"重命名 info 文件失败（权限不足）: {e}")
                     except OSError as e:
                         log.warning(f"重命名 info 文件失败: {e}")
 
-            cover_exists = any((mod_dir / f"cover{ext}").exists() for ext in [".png", ".jpg", ".jpeg"])
+            cover_exists = any(n in root_files for n in ("cover.png", "cover.jpg", "cover.jpeg"))
             if not cover_exists:
                 cover_dst = mod_dir / "cover.png"
                 cover_src = None
@@ -392,17 +635,17 @@ class LibraryManager:
                     if cand.exists() and cand.is_file():
                         cover_src = cand
                         break
-                if cover_src is None:
+                if cover_src is None and deep_search:
                     try:
-                        for f in mod_dir.rglob("cover.bank"):
-                            if f.is_file():
-                                cover_src = f
+                        for entry, _, _ in self._iter_files_scandir(mod_dir):
+                            if entry.name.lower() == "cover.bank":
+                                cover_src = Path(entry.path)
                                 break
                     except Exception:
                         pass
                 if cover_src and not cover_dst.exists():
                     try:
-                        shutil.move(str(cover_src), str(cover_dst))
+                        os.replace(cover_src, cover_dst)
                         log.debug(f"已重命名 {cover_src.name} -> cover.png")
                     except PermissionError as e:
                         log.warning(f"重命名封面文件失败（权限不足）: {e}")
@@ -414,6 +657,8 @@ class LibraryManager:
     def get_mod_details(self, mod_name: str) -> dict[str, Any]:
         """
         读取语音包的元数据与资源信息，生成前端展示所需的详情字典。
+
+        结果按语音包目录的 mtime 缓存，目录未变化时直接返回缓存副本。
         
         Args:
             mod_name: 语音包名称
@@ -422,6 +667,31 @@ class LibraryManager:
             包含语音包详细信息的字典
         """
         mod_dir = self.library_dir / mod_name
+        try:
+            mtime_ns = mod_dir.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        cached = self._details_cache.get(mod_name)
+        if cached is not None and mtime_ns is not None and cached[0] == mtime_ns:
+            return dict(cached[1])
+
+        details = self._collect_mod_details(mod_name, mod_dir)
+
+        # 规范化文件名/封面改名会更新目录 mtime，因此在收集完成后重新取值作为缓存键
+        try:
+            entry = (mod_dir.stat().st_mtime_ns, details)
+        except OSError:
+            entry = None
+        with self._details_cache_lock:
+            if entry is not None:
+                self._details_cache[mod_name] = entry
+            else:
+                self._details_cache.pop(mod_name, None)
+        return dict(details)
+
+    def _collect_mod_details(self, mod_name: str, mod_dir: Path) -> dict[str, Any]:
+        # 实际扫描语音包目录并生成详情字典（不经过缓存）。
         info_file = mod_dir / "info.json"
         self._normalize_wtlive_compat_files(mod_dir)
         
@@ -451,40 +721,33 @@ class LibraryManager:
 
         # 2. 读取 info.json (支援 WTLive 伪装格式)
         # 逻辑: info.json > info/info.json > *（AimerWT）.bank > info/*（AimerWT）.bank
-        info_candidates = []
-        
-        # (1) 标准 info.json
-        info_candidates.append(mod_dir / "info.json")
-        info_candidates.append(mod_dir / "info" / "info.json")
+        # 根目录与 info 子目录各只列举一次，后续 info / 封面检测均复用这份文件名表
+        info_dir = mod_dir / "info"
+        root_files = self._list_file_names(mod_dir)
+        info_files = self._list_file_names(info_dir)
+
+        info_candidates = [root_files.get("info.json"), info_files.get("info.json")]
         
         # (2) 伪装的 .bank 文件 (检测 （AimerWT） 字样)
-        try:
-            info_candidates.extend(list(mod_dir.glob("*（AimerWT）.bank")))
-            info_candidates.extend(list(mod_dir.glob("*(AimerWT).bank")))
-            if (mod_dir / "info").exists():
-                info_candidates.extend(list((mod_dir / "info").glob("*（AimerWT）.bank")))
-                info_candidates.extend(list((mod_dir / "info").glob("*(AimerWT).bank")))
-        except PermissionError as e:
-            log.warning(f"扫描 info 文件失败（权限不足）: {e}")
-        except Exception as e:
-            log.warning(f"Glob 搜索出错: {type(e).__name__}: {e}")
+        for files in (root_files, info_files):
+            for suffix in ("（aimerwt）.bank", "(aimerwt).bank"):
+                info_candidates.extend(path for name, path in files.items() if name.endswith(suffix))
 
-        found_info_file = None
-        for cand in info_candidates:
-            if cand and cand.exists():
-                found_info_file = cand
-                break
+        found_info_file = next((Path(cand) for cand in info_candidates if cand), None)
         if not found_info_file:
             try:
-                info_jsons = [p for p in mod_dir.rglob("info.json") if p.is_file()]
-                info_jsons.sort(key=lambda p: len(p.parts))
-                if info_jsons:
-                    found_info_file = info_jsons[0]
-                else:
-                    aimer_banks = [p for p in mod_dir.rglob("*.bank") if p.is_file() and "aimerwt" in p.name.lower()]
-                    aimer_banks.sort(key=lambda p: len(p.parts))
-                    if aimer_banks:
-                        found_info_file = aimer_banks[0]
+                # 单次遍历同时收集 info.json 与伪装的 （AimerWT） .bank，各取层级最浅者
+                info_jsons = []
+                aimer_banks = []
+                for entry, _, _ in self._iter_files_scandir(mod_dir):
+                    name = entry.name.lower()
+                    if name == "info.json":
+                        info_jsons.append(entry.path)
+                    elif name.endswith(".bank") and "aimerwt" in name:
+                        aimer_banks.append(entry.path)
+                found = info_jsons or aimer_banks
+                if found:
+                    found_info_file = Path(min(found, key=lambda p: p.count(os.sep)))
             except Exception:
                 pass
         
@@ -500,73 +763,50 @@ class LibraryManager:
             except Exception as e:
                 log.warning(f"读取 info.json 失败: {e}")
 
+        # 检测封面文件（包含对 cover.bank 的兼容处理）
+        for d, files in ((mod_dir, root_files), (info_dir, info_files)):
+            if "cover.bank" not in files or "cover.png" in files:
+                continue
+            # 将 cover.bank 统一为 cover.png 以便前端按固定文件名读取
+            bank_path = Path(files.pop("cover.bank"))
+            new_path = d / "cover.png"
+            try:
+                os.replace(bank_path, new_path)
+                files["cover.png"] = str(new_path)
+                log.info(f"[AutoFix] 已将 {bank_path.name} 恢复为 {new_path.name}")
+            except Exception as e:
+                log.warning(f"重命名封面失败: {e}")
+
+        # 单次遍历目录：同时得到大小、.bank 文件夹详情与推断标签
+        size_str, folders, detected_tags = self._scan_mod_cached(mod_name, mod_dir)
+
         # 基于文件规则推断 tags（仅推断功能标签；language 不进行推断）
-        detected_tags = self._detect_smart_tags(mod_dir)
         if detected_tags:
-            combined_tags = []
-            for t in list(details["tags"]) + list(detected_tags):
-                if t not in combined_tags:
-                    combined_tags.append(t)
-            details["tags"] = combined_tags
+            # 保序去重：作者填写的标签在前，推断标签在后
+            details["tags"] = list(dict.fromkeys([*details["tags"], *detected_tags]))
             
         # 如果作者没写语言，则显示"未识别"
         if not details["language"]:
             details["language"] = ["未识别"]
 
         # 将 tags 映射为前端使用的 capabilities 键
-        cap_map = {
-            "tank": "tank", "陆战": "tank", "ground": "tank",
-            "air": "air", "空战": "air", "aircraft": "air",
-            "naval": "naval", "海战": "naval",
-            "radio": "radio", "无线电": "radio", "无线电/局势": "radio",
-            "status": "status", "局势播报": "radio",
-            "missile": "missile", "导弹音效": "missile",
-            "music": "music", "音乐包": "music",
-            "noise": "noise", "降噪包": "noise",
-            "pilot": "pilot", "飞行员语音": "pilot"
-        }
         for t in details["tags"]:
-            if t in cap_map:
-                details["capabilities"][cap_map[t]] = True
-            elif t in ["tank", "air", "naval", "radio", "status", "missile", "music", "noise", "pilot"]:
-                 details["capabilities"][t] = True
+            cap = _CAPABILITY_MAP.get(t)
+            if cap:
+                details["capabilities"][cap] = True
 
         # 5. 计算大小
-        details["size_str"] = self._get_dir_size_str(mod_dir)
-
-        # 检测封面文件（包含对 cover.bank 的兼容处理）
-        potential_cover_banks = [
-            mod_dir / "cover.bank",
-            mod_dir / "info" / "cover.bank"
-        ]
-        
-        for bank_path in potential_cover_banks:
-            if bank_path.exists():
-                # 将 cover.bank 统一为 cover.png 以便前端按固定文件名读取
-                new_path = bank_path.with_suffix(".png")
-                try:
-                    bank_path.rename(new_path)
-                    log.info(f"[AutoFix] 已将 {bank_path.name} 恢复为 {new_path.name}")
-                except Exception as e:
-                    log.warning(f"重命名封面失败: {e}")
+        details["size_str"] = size_str
 
         # 扫描封面 (支持根目录和 info 子目录)
-        search_dirs = [mod_dir, mod_dir / "info"]
-        found_cover = False
-        
-        for d in search_dirs:
-            if found_cover: break
-            if not d.exists(): continue
-            
-            for img_ext in [".png", ".jpg", ".jpeg"]:
-                img_path = d / f"cover{img_ext}"
-                if img_path.exists():
-                    details["cover_path"] = str(img_path)
-                    found_cover = True
-                    break
+        for files in (root_files, info_files):
+            cover = next((files[n] for n in ("cover.png", "cover.jpg", "cover.jpeg") if n in files), None)
+            if cover:
+                details["cover_path"] = cover
+                break
         
         # 7. 文件夹详情
-        details["folders"] = self._detect_mod_folders(mod_dir)
+        details["folders"] = folders
         
         # 对特定语音包名称提供固定展示字段，用于界面展示数据复盖
         if mod_name == "Aimer":
@@ -585,192 +825,195 @@ class LibraryManager:
         
         return details
 
-    def _detect_smart_tags(self, mod_dir):
-        # 基于语音包目录内 .bank 文件的命名规则推断功能标签（tags）。
-        detected_tags = set()
-        
+    def _list_file_names(self, dir_path):
+        # 列举目录下的普通文件，返回 {小写文件名: 完整路径}；目录不存在或无法访问时返回空字典。
+        files = {}
         try:
-            # 遍历所有 .bank 文件
-            for f in mod_dir.rglob("*.bank"):
-                if not f.is_file(): continue
-                name = f.name.lower()
-                if name in [
-                    "crew_dialogs_common.assets.bank",
-                    "crew_dialogs_common.bank",
-                    "crew_dialogs_ground.assets.bank",
-                    "crew_dialogs_ground.bank",
-                    "crew_dialogs_naval.assets.bank",
-                    "crew_dialogs_naval.bank",
-                    "masterbank.assets.bank",
-                    "masterbank.bank"
-                ]:
-                    detected_tags.add("noise")
-                if re.match(r'dialogs_chat_[a-z0-9]+\.bank$', name):
-                    detected_tags.add("pilot")
-                
-                # 1. 陆战
-                # 匹配: _crew_dialogs_ground_cn.assets.bank
-                m_ground = re.match(r'(_)?crew_dialogs_ground_([a-z0-9]+)\.assets\.bank', name)
-                if m_ground:
-                    detected_tags.add("tank")
-                    continue
-                # 兼容无后缀
-                if "crew_dialogs_ground.assets.bank" in name:
-                    detected_tags.add("tank")
-                    continue
-                    
-                # 2. 无线电/局势 (合并原来的无线电和局势播报)
-                m_radio = re.match(r'(_)?crew_dialogs_common_([a-z0-9]+)\.assets\.bank', name)
-                if m_radio:
-                    detected_tags.add("radio")
-                    continue
-                if "crew_dialogs_common.assets.bank" in name:
-                    detected_tags.add("radio")
-                    continue
-                    
-                # 3. 空战 (仅检测 aircraft_gui.assets.bank)
-                if name == "aircraft_gui.assets.bank":
-                    detected_tags.add("air")
-                    continue
-                
-                # 4. 导弹音效 (检测多个文件)
-                if name in ["aircraft_common.assets.bank", "aircraft_effects.assets.bank", 
-                           "aircraft_guns.assets.bank", "aircraft_guns.bank"]:
-                    detected_tags.add("missile")
-                    continue
-                
-                # 5. 音乐包 (检测带有 aircraft_music 字样的文件)
-                if "aircraft_music" in name:
-                    detected_tags.add("music")
-                    continue
-                    
-        except Exception as e:
-            log.warning(f"智能检测出错: {e}")
-            
-        return list(detected_tags)
-
-    def _map_lang_code(self, code):
-        """映射语言代码到 UI 显示字符"""
-        mapping = {
-            "zh": "中", "cn": "中", "chs": "中",
-            "en": "美", "us": "美", "uk": "美",
-            "ru": "俄",
-            "de": "德",
-            "jp": "日", "ja": "日",
-            "fr": "法",
-            "it": "意",
-            "se": "瑞",
-            "il": "以"
-        }
-        return mapping.get(code, code.upper())
-
-
-    def _detect_mod_folders(self, mod_dir):
-        """
-        递归扫描 .bank 文件，返回它们所在的上一级文件夹名称（相对路径）
-        去除重复，并按名称排序
-        """
-        folders_map = {}
-        try:
-            # 查找所有 .bank 文件 (不区分大小写，但 glob 通常区分，所以写两次或用正则)
-            # Windows 下 glob 通常不区分大小写，但为了保险
-            all_files = list(mod_dir.rglob("*.bank")) + list(mod_dir.rglob("*.BANK"))
-            
-            for f in all_files:
-                if f.is_file():
-                    parent = f.parent
+            with os.scandir(dir_path) as it:
+                for entry in it:
                     try:
-                        # 获取相对于 mod_dir 的路径
-                        rel_path = parent.relative_to(mod_dir)
-                        path_str = str(rel_path).replace("\\", "/") # 统一使用正斜杠
-                        
-                        if path_str not in folders_map:
-                            folder_type = self._determine_folder_type(parent)
-                            folders_map[path_str] = {
-                                "path": path_str if path_str != "." else "根目录",
-                                "type": folder_type,
-                                "label": path_str if path_str != "." else "根目录"
-                            }
-                    except ValueError:
+                        if entry.is_file():
+                            files.setdefault(entry.name.lower(), entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return files
+
+    def _iter_files_scandir(self, path):
+        # 以 os.scandir 遍历目录树（显式栈，不创建 Path 对象），产出 (DirEntry, 所在目录相对路径, 深度)；
+        # 仅产出普通文件，跳过符号链接与无法访问的目录。相对路径以 "/" 分隔，根目录为 "."。
+        stack = [(str(path), ".", 0)]
+        while stack:
+            dir_path, rel_path, depth = stack.pop()
+            try:
+                it = os.scandir(dir_path)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            child_rel = entry.name if rel_path == "." else f"{rel_path}/{entry.name}"
+                            stack.append((entry.path, child_rel, depth + 1))
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry, rel_path, depth
+                    except OSError:
                         continue
-        except Exception as e:
-            log.warning(f"扫描文件夹出错: {e}")
-        
-        return sorted(list(folders_map.values()), key=lambda x: x["path"])
 
-    def _determine_folder_type(self, folder_path):
-        """
-        根据文件夹内的文件名判断文件夹类型
-        优先级: 陆战 > 无线电 > 空战 > 默认
-        """
+    def _scan_mod_cached(self, mod_name, mod_dir):
+        # 以语音包目录及其直接子目录的最大 mtime 作为版本戳，命中 .size.cache 时跳过整个目录遍历；
+        # 未命中则调用 _scan_mod_once 并更新内存缓存（标记待写盘，由 _flush_scan_cache 统一写入）。
         try:
-            # 获取文件夹下所有文件名
-            filenames = [f.name for f in folder_path.iterdir() if f.is_file()]
-            
-            # 1. 陆战语音: _crew_dialogs_ground_<国家缩写>.assets.bank
-            # 兼容: crew_dialogs_ground.assets.bank (无前缀/后缀)
-            for name in filenames:
-                if re.match(r'(_)?crew_dialogs_ground.*\.assets\.bank', name, re.IGNORECASE):
-                    return "ground"
-            
-            # 2. 无线电语音: _crew_dialogs_common_<国家缩写>.assets.bank
-            # 兼容: crew_dialogs_common.assets.bank
-            for name in filenames:
-                if re.match(r'(_)?crew_dialogs_common.*\.assets\.bank', name, re.IGNORECASE):
-                    return "radio"
-            
-            # 3. 空战音效: aircraft_guns.assets.bank 或 aircraft_gui.assets.bank
-            for name in filenames:
-                if re.match(r'aircraft_guns\.assets\.bank', name, re.IGNORECASE) or \
-                   re.match(r'aircraft_gui\.assets\.bank', name, re.IGNORECASE):
-                    return "aircraft"
-            
-            return "folder"
-            
-        except Exception:
-            return "folder"
+            stamp = os.stat(mod_dir).st_mtime_ns
+            with os.scandir(mod_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stamp = max(stamp, entry.stat(follow_symlinks=False).st_mtime_ns)
+        except OSError:
+            return self._scan_mod_once(mod_dir)
 
-    def _detect_mod_capabilities(self, mod_dir):
-        """[已废弃] 旧的检测逻辑"""
-        return {}
+        with self._scan_cache_lock:
+            if self._scan_cache is None:
+                self._scan_cache = self._load_scan_cache()
+            entry = self._scan_cache.get(mod_name)
+        if isinstance(entry, dict) and entry.get("mtime") == stamp:
+            try:
+                return entry["size_str"], entry["folders"], entry["tags"]
+            except KeyError:
+                pass
+
+        size_str, folders, detected_tags = self._scan_mod_once(mod_dir)
+        with self._scan_cache_lock:
+            self._scan_cache[mod_name] = {
+                "mtime": stamp,
+                "size_str": size_str,
+                "folders": folders,
+                "tags": detected_tags,
+            }
+            self._scan_cache_dirty = True
+        return size_str, folders, detected_tags
+
+    def _flush_scan_cache(self):
+        # 有未写盘的改动时把扫描缓存写入 .size.cache；一轮扫描/导入结束后调用一次。
+        with self._scan_cache_lock:
+            if not self._scan_cache_dirty or self._scan_cache is None:
+                return
+            self._scan_cache_dirty = False
+            self._save_scan_cache()
+
+    def _load_scan_cache(self):
+        # 读取 .size.cache；文件不存在或损坏时返回空字典。
+        try:
+            with open(self.library_dir / _SCAN_CACHE_NAME, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_scan_cache(self):
+        # 先写入同目录临时文件，再通过 os.replace 原子替换 .size.cache（调用方持有 _scan_cache_lock）。
+        cache_file = self.library_dir / _SCAN_CACHE_NAME
+        temp_file = cache_file.with_name(cache_file.name + ".tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(self._scan_cache, f, ensure_ascii=False)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            log.debug(f"写入扫描缓存失败: {e}")
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
 
-    def _get_dir_size_str(self, path):
-        """计算文件夹大小并格式化（优化版本）"""
+    def _scan_mod_once(self, mod_dir):
+        # 单次遍历语音包目录 (_iter_files_scandir)，同时统计：
+        # 目录大小字符串、含 .bank 文件的文件夹详情列表、基于 .bank 命名推断的标签列表。
         total_size = 0
+        file_count = 0
+        size_capped = False
+        max_files = 5000  # 大小最多统计5000个文件
+        max_depth = 10    # 大小最多统计10层深度
+
+        detected_tags = set()
+        folder_ranks = {}  # 相对路径 -> 类型优先级
         try:
-            # 优化：限制遍历深度和文件数量，避免大目录卡死
-            file_count = 0
-            max_files = 5000  # 最多统计5000个文件
-            max_depth = 10    # 最多遍历10层深度
-            
-            for dirpath, dirnames, filenames in os.walk(path):
-                # 检查深度
-                rel_path = os.path.relpath(dirpath, path)
-                depth = rel_path.count(os.sep) if rel_path != '.' else 0
-                if depth > max_depth:
-                    continue
-                
-                for f in filenames:
+            for entry, rel_path, depth in self._iter_files_scandir(mod_dir):
+                if depth <= max_depth and not size_capped:
                     if file_count >= max_files:
-                        # 达到上限，返回估算值
-                        mb_size = total_size / (1024 * 1024)
-                        return f"~{int(mb_size)} MB+"
-                    
-                    fp = os.path.join(dirpath, f)
-                    if not os.path.islink(fp):
+                        size_capped = True
+                    else:
                         try:
-                            total_size += os.path.getsize(fp)
-                        except:
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
                             pass
-                    file_count += 1
+                        file_count += 1
+
+                name = entry.name.lower()
+                if not name.endswith(".bank"):
+                    continue
+                prev = folder_ranks.get(rel_path)
+                tags_done = len(detected_tags) >= _ALL_TAGS_COUNT
+                if prev == 0 and tags_done:
+                    # 文件夹已判定为最高优先级（陆战）且标签已齐全，无需再匹配文件名
+                    continue
+                m = _BANK_RE.match(name)
+                kind = m.lastgroup if m else None
+                if not tags_done:
+                    self._classify_bank_tags(name, kind, detected_tags)
+                rank = _FOLDER_RANKS.get(kind, 3)
+                if prev is None or rank < prev:
+                    folder_ranks[rel_path] = rank
         except Exception as e:
-            log.warning(f"计算目录大小失败: {e}")
-            return "未知"
-        
+            log.warning(f"扫描语音包目录出错: {e}")
+
         mb_size = total_size / (1024 * 1024)
-        if mb_size < 1:
-            return "<1 MB"
-        return f"{int(mb_size)} MB"
+        if size_capped:
+            # 达到上限，返回估算值
+            size_str = f"~{int(mb_size)} MB+"
+        elif mb_size < 1:
+            size_str = "<1 MB"
+        else:
+            size_str = f"{int(mb_size)} MB"
+
+        folders = []
+        for path_str, rank in folder_ranks.items():
+            label = path_str if path_str != "." else "根目录"
+            folders.append({"path": label, "type": _FOLDER_TYPES[rank], "label": label})
+        folders.sort(key=lambda x: x["path"])
+
+        return size_str, folders, list(detected_tags)
+
+    def _classify_bank_tags(self, name, kind, detected_tags):
+        # 基于单个 .bank 文件名（小写）的命名规则推断功能标签（tags），写入 detected_tags。
+        # kind 为 _BANK_RE 的匹配分组名（ground/common/gui/guns），未匹配时为 None。
+        if name in _NOISE_NAMES:
+            detected_tags.add("noise")
+        if _CHAT_BANK_RE.match(name):
+            detected_tags.add("pilot")
+        
+        # 1. 陆战: _crew_dialogs_ground_cn.assets.bank / crew_dialogs_ground.assets.bank
+        # 2. 无线电/局势: _crew_dialogs_common_cn.assets.bank / crew_dialogs_common.assets.bank
+        # 3. 空战 (仅检测 aircraft_gui.assets.bank)
+        tag = _BANK_KIND_TAGS.get(kind)
+        if tag:
+            detected_tags.add(tag)
+            return
+        
+        # 4. 导弹音效 (检测多个文件)
+        if name in _MISSILE_NAMES:
+            detected_tags.add("missile")
+            return
+        
+        # 5. 音乐包 (检测带有 aircraft_music 字样的文件)
+        if "aircraft_music" in name:
+            detected_tags.add("music")
+
+    def _detect_mod_capabilities(self, mod_dir):
+        """[已废弃] 旧的检测逻辑"""
+        return {}
 
     def _detect_mod_capabilities(self, mod_dir):
         # 兼容旧版接口签名的占位实现。
@@ -779,36 +1022,26 @@ class LibraryManager:
     def _is_safe_path(self, path, base_dir):
         # 校验路径是否位于指定基准目录内，用于限制删除/移动等文件操作的作用范围。
         try:
-            abs_path = Path(path).resolve()
-            abs_base = Path(base_dir).resolve()
-            path_str = str(abs_path).lower()
+            # realpath 解析符号链接后再比较，避免借助链接逃逸出基准目录
+            abs_path = os.path.realpath(path)
+            base_str = os.fspath(base_dir)
+            if base_str == os.fspath(self.library_dir):
+                abs_base = self._abs_library_dir
+            elif base_str == os.fspath(self.pending_dir):
+                abs_base = self._abs_pending_dir
+            else:
+                abs_base = os.path.realpath(base_dir)
+            if _IS_WINDOWS:
+                # 兼容大小写不敏感系统(Windows)
+                abs_path, abs_base = abs_path.lower(), abs_base.lower()
 
             # 1. 绝对禁止删除系统根目录或关键系统目录
-            forbidden_roots = [
-                "c:\\", "c:/", "c:\\windows", "c:\\program files", "c:\\program files (x86)", "c:\\users",
-                "/", "/bin", "/boot", "/dev", "/etc", "/home", "/lib", "/lib64", "/media", "/mnt", "/opt",
-                "/proc", "/root", "/run", "/sbin", "/srv", "/sys", "/tmp", "/usr", "/var"
-            ]
-            if path_str in forbidden_roots:
+            if abs_path.lower().rstrip("/\\") in _FORBIDDEN_ROOTS:
                 return False
 
-            # 2. 如果路径在 C 盘(Windows)，必须在 base_dir 白名单内
-            if platform.system() == "Windows" and abs_path.drive.lower() == "c:":
-                if not str(abs_path).startswith(str(abs_base)):
-                    return False
-            
-            # 3. Linux/Mac 基础保护 (不允许操作 / 根目录)
-            if platform.system() != "Windows":
-                 if str(abs_path) == "/":
-                     return False
-
-            # 4. 基础检查：是否在 base_dir 内部
-            # 兼容大小写不敏感系统(Windows/macOS) 和 敏感系统(Linux)
-            if platform.system() == "Windows":
-                 return str(abs_path).lower().startswith(str(abs_base).lower())
-            else:
-                 return str(abs_path).startswith(str(abs_base))
-        except:
+            # 2. 必须位于 base_dir 内部（或就是 base_dir 本身）
+            return abs_path == abs_base or abs_path.startswith(os.path.join(abs_base, ""))
+        except (OSError, ValueError, TypeError):
             return False
 
     def _find_7z(self):
@@ -821,15 +1054,51 @@ class LibraryManager:
             or shutil.which("7zr.exe")
         )
 
-    def _run_7z(self, args):
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            errors="ignore",
-        )
-        output = (result.stdout or "") + "\n" + (result.stderr or "")
-        return result.returncode, output
+    def _run_7z(self, args, on_progress=None):
+        # 运行 7z 并返回 (退出码, 输出文本)。stdout/stderr 合併后边读边处理，
+        # on_progress(percent) 接收 -bsp1 输出的百分比进度（7z 以退格覆盖，不换行，因此按块解析）。
+        # 输出只保留最后 _7Z_OUTPUT_TAIL_CHARS 个字符，外加最近 _7Z_HINT_LINES_MAX 条与密码相关的行，内存占用与文件数量无关。
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        # 按区域编码增量解码（与 text=True 一致；中文 Windows 上 7z 输出为 ANSI/OEM 代码页），
+        # 跨块截断的多字节字符留待下一块拼接
+        decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+        tail = deque()
+        tail_len = 0
+        hint_lines = deque(maxlen=_7Z_HINT_LINES_MAX)
+        # 跨块的未完整行：与下一块拼接后再按行匹配，避免关键字被读取边界截断
+        pending = ""
+        carry = ""
+        last_percent = -1
+        with proc:
+            while True:
+                data = proc.stdout.read1(65536)
+                text = decoder.decode(data, final=not data)
+                if text:
+                    tail.append(text)
+                    tail_len += len(text)
+                while tail_len > _7Z_OUTPUT_TAIL_CHARS and len(tail) > 1:
+                    tail_len -= len(tail.popleft())
+                lines = _7Z_LINE_SPLIT_RE.split(pending + text)
+                # 未结束时最后一段可能是半行，留待下一块；长度受限以防无分隔的输出持续累积
+                pending = lines.pop()[-_7Z_OUTPUT_TAIL_CHARS:] if data else ""
+                hint_lines.extend(
+                    line for line in lines
+                    if any(h in line.lower() for h in _7Z_PASSWORD_HINTS)
+                )
+                if on_progress:
+                    found = _7Z_PERCENT_RE.findall(carry + text)
+                    carry = text[-4:]
+                    if found:
+                        percent = int(found[-1])
+                        if percent != last_percent:
+                            last_percent = percent
+                            on_progress(percent)
+                if not data:
+                    break
+        output = _7Z_PROGRESS_FRAGMENT_RE.sub("", "".join(tail))
+        # 密码相关行已在末尾输出中时不再重复
+        hint_lines = [line for line in hint_lines if line not in output]
+        return proc.returncode, "\n".join(hint_lines + [output])
 
     def _extract_with_7z(self, archive_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password=None):
         seven_zip = self._find_7z()
@@ -843,18 +1112,31 @@ class LibraryManager:
                 pass
 
         password_arg = f"-p{password or ''}"
+        # -bsp1: 进度输出到 stdout；-mmt=on: 允许多线程解码
         args = [
             seven_zip,
             "x",
             "-y",
+            "-bsp1",
+            "-mmt=on",
             password_arg,
             f"-o{str(target_dir)}",
             str(archive_path),
         ]
-        code, output = self._run_7z(args)
+        archive_name = Path(archive_path).name
+
+        def _on_progress(percent):
+            if not progress_callback:
+                return
+            try:
+                progress_callback(int(base_progress + percent / 100 * share_progress), f"解压中: {archive_name}")
+            except Exception:
+                pass
+
+        code, output = self._run_7z(args, _on_progress if progress_callback else None)
         if code != 0:
             lower = output.lower()
-            if "password" in lower or "wrong password" in lower or "incorrect" in lower or "encrypted" in lower:
+            if any(h in lower for h in _7Z_PASSWORD_HINTS):
                 if password:
                     raise ArchivePasswordIncorrect("密码错误")
                 raise ArchivePasswordRequired("需要密码")
@@ -866,42 +1148,50 @@ class LibraryManager:
             except Exception:
                 pass
 
-    def _extract_archive_with_password(self, archive_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password_provider=None):
+    def _extract_archive_with_password(self, archive_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password_provider=None, verify_crc=True):
+        # ZIP 只打开（解析中央目录）一次，密码重试时複用同一个 ZipFile
         password = None
-        while True:
-            try:
-                if archive_path.suffix.lower() == ".zip":
-                    try:
-                        self._extract_zip_safely(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password)
-                    except (NotImplementedError, RuntimeError) as e:
-                        msg = str(e).lower()
-                        if "compression method is not supported" in msg:
-                            self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password)
-                        else:
-                            raise
-                elif archive_path.suffix.lower() in (".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tgz", ".tbz2"):
-                    self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password)
-                else:
-                    raise Exception(f"不支持的压缩格式: {archive_path.suffix}")
-                return
-            except ArchivePasswordRequired:
-                if not password_provider:
-                    raise
-                password = password_provider(archive_path, "required")
-                if password is None:
-                    raise ArchivePasswordCanceled("用户取消输入密码")
-            except ArchivePasswordIncorrect:
+        zf = None
+        try:
+            while True:
                 try:
-                    self.log("密码错误，请重试", "WARN")
-                except Exception:
-                    pass
-                if not password_provider:
-                    raise
-                password = password_provider(archive_path, "incorrect")
-                if password is None:
-                    raise ArchivePasswordCanceled("用户取消输入密码")
-
-    def unzip_single_zip(self, zip_path, progress_callback=None, password_provider=None):
+                    if archive_path.suffix.lower() == ".zip":
+                        try:
+                            if zf is None:
+                                zf = zipfile.ZipFile(archive_path, 'r')
+                            self._extract_zip_safely(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password, verify_crc=verify_crc, zf=zf)
+                        except (NotImplementedError, RuntimeError) as e:
+                            msg = str(e).lower()
+                            if "compression method is not supported" in msg:
+                                self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password)
+                            else:
+                                raise
+                    elif archive_path.suffix.lower() in (".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tgz", ".tbz2"):
+                        self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password)
+                    else:
+                        raise Exception(f"不支持的压缩格式: {archive_path.suffix}")
+                    return
+                except ArchivePasswordRequired:
+                    if not password_provider:
+                        raise
+                    password = password_provider(archive_path, "required")
+                    if password is None:
+                        raise ArchivePasswordCanceled("用户取消输入密码")
+                except ArchivePasswordIncorrect:
+                    try:
+                        self.log("密码错误，请重试", "WARN")
+                    except Exception:
+                        pass
+                    if not password_provider:
+                        raise
+                    password = password_provider(archive_path, "incorrect")
+                    if password is None:
+                        raise ArchivePasswordCanceled("用户取消输入密码")
+        finally:
+            if zf is not None:
+                zf.close()
+
+    def unzip_single_zip(self, zip_path, progress_callback=None, password_provider=None, verify_crc=True):
         """
         功能定位:
         - 将单个 ZIP/RAR 压缩包解压导入到语音包库目录（以压缩包文件名作为语音包目录名）。
@@ -911,6 +1201,7 @@ class LibraryManager:
           - zip_path: str | Path，压缩包路径（.zip/.rar）。
           - progress_callback: Callable[[int, str], None] | None，进度回调。
           - password_provider: Callable[[Path, str], str | None] | None，密码提供器；reason 取值 required/incorrect。
+          - verify_crc: bool，是否校验 ZIP 成员的 CRC-32；对受信任的语音包可传 False 跳过校验以加快解压。
         - 返回: None
         - 外部资源/依赖:
           - 目录: self.library_dir（写入目标语音包目录）
@@ -936,42 +1227,35 @@ class LibraryManager:
             ext_list = ", ".join(self.SUPPORTED_EXTENSIONS)
             raise ValueError(f"不支持的文件格式。支持的格式: {ext_list}")
 
-        # 磁盘空间估算与校验
+        # 磁盘空间估算与校验（扣减推迟到目标目录创建成功之后）
+        estimated_size = 0
         try:
-            zip_size = os.path.getsize(zip_path)
-            # 估算解压后大小 (通常是压缩包的 2-3 倍，这里保守估计 3 倍)
-            estimated_size = zip_size * 3
-            # 需要至少 2 倍的估算空间作为安全余量 (解压过程可能产生临时文件)
-            required_space = estimated_size * 2
-            
-            target_drive = Path(self.library_dir).anchor # 获取盘符 (如 C:\)
-            if not target_drive: target_drive = self.library_dir
-            
-            import shutil
-            total, used, free = shutil.disk_usage(target_drive)
-            
-            if free < required_space:
-                free_mb = free / (1024 * 1024)
-                required_mb = required_space / (1024 * 1024)
-                self.log(f"磁盘空间不足! 可用: {free_mb:.0f}MB, 需要: {required_mb:.0f}MB", "ERROR")
-                raise Exception(f"磁盘空间不足 (需 {required_mb:.0f}MB)")
-                
+            estimated_size = self._check_disk_space(zip_path, self._get_free_space())
+        except DiskSpaceError:
+            raise # 重新抛出给上层处理
         except Exception as e:
-            if "磁盘空间不足" in str(e):
-                raise e # 重新抛出给上层处理
             self.log(f"磁盘空间检查失败 (跳过检查): {e}", "WARN")
 
         mod_name = zip_path.stem
         target_dir = self.library_dir / mod_name
         
-        if target_dir.exists():
+        # 以 mkdir 的原子性判断重复：并行导入同名压缩包时只有一个线程能创建成功
+        try:
+            target_dir.mkdir()
+        except FileExistsError:
             self.log(f"[SKIPPED] 跳过重复: {mod_name} (库中已存在)", "WARN")
             self.log("提示: 如果想重新导入，请先删除库中的同名文件夹。", "INFO")
             if progress_callback: progress_callback(100, "跳过重复文件")
             return
+        except OSError as e:
+            # 权限不足、库目录不存在等：与解压失败一样记录错误后抛给上层
+            self.log(f"[ERROR] 导入失败: {e}", "ERROR")
+            raise
+
+        # 确定会写入后才从可用空间快照中扣减；导入失败回滚时再加回
+        space_stamp = self._consume_free_space(estimated_size)
         
         try:
-            target_dir.mkdir()
             self.log(f"[UNZIP] 正在导入: {zip_path.name}", "UNZIP")
 
             self._extract_archive_with_password(
@@ -981,24 +1265,89 @@ class LibraryManager:
                 0,
                 100,
                 password_provider=password_provider,
+                verify_crc=verify_crc,
             )
-            self._normalize_wtlive_compat_files(target_dir)
+            self._normalize_wtlive_compat_files(target_dir, deep_search=True)
+            self._warm_mod_cache(mod_name)
             self.log(f"[SUCCESS] 导入成功: {mod_name}", "SUCCESS")
         except ArchivePasswordCanceled:
             self.log("[WARN] 已取消输入密码，导入已终止", "WARN")
             if target_dir.exists():
                 try: shutil.rmtree(target_dir)
                 except: pass
+            self._release_free_space(estimated_size, space_stamp)
             raise
         except Exception as e:
             self.log(f"[ERROR] 导入失败: {e}", "ERROR")
             if target_dir.exists():
                 try: shutil.rmtree(target_dir)
                 except: pass
+            self._release_free_space(estimated_size, space_stamp)
             raise
 
-    def unzip_zips_to_library(self, progress_callback=None, password_provider=None):
+    def _warm_mod_cache(self, mod_name):
+        # 导入完成后立即生成语音包详情，写入内存缓存与 .size.cache；
+        # 此时目录项仍在系统缓存中，之后刷新列表（包括重启后）无需再遍历该目录。
+        try:
+            self.get_mod_details(mod_name)
+            self._flush_scan_cache()
+        except Exception as e:
+            log.debug(f"预生成语音包详情失败: {e}")
+
+    def _get_free_space(self) -> int:
+        # 返回语音包库所在磁盘的可用空间 (字节)；_DISK_CACHE_TTL 内复用上次查询结果。
+        target_drive = Path(self.library_dir).anchor # 获取盘符 (如 C:\)
+        if not target_drive: target_drive = str(self.library_dir)
+        now = time.monotonic()
+        with self._disk_cache_lock:
+            cached = self._disk_cache.get(target_drive)
+            if cached is not None and now - cached[0] < _DISK_CACHE_TTL:
+                return cached[1]
+        free = shutil.disk_usage(target_drive).free
+        with self._disk_cache_lock:
+            self._disk_cache[target_drive] = (now, free)
+        return free
+
+    def _consume_free_space(self, size):
+        # 从可用空间快照中扣减即将写入的估算大小，快照过期前的后续导入据此判断。
+        # 返回被扣减快照的查询时间，供 _release_free_space 判断快照是否仍是同一份；无快照时返回 None。
+        target_drive = Path(self.library_dir).anchor or str(self.library_dir)
+        with self._disk_cache_lock:
+            cached = self._disk_cache.get(target_drive)
+            if cached is None:
+                return None
+            self._disk_cache[target_drive] = (cached[0], max(0, cached[1] - size))
+            return cached[0]
+
+    def _release_free_space(self, size, stamp):
+        # 导入失败回滚后把扣减的估算大小加回快照；快照已重新查询过（反映真实磁盘）则不再调整。
+        if stamp is None or not size:
+            return
+        target_drive = Path(self.library_dir).anchor or str(self.library_dir)
+        with self._disk_cache_lock:
+            cached = self._disk_cache.get(target_drive)
+            if cached is not None and cached[0] == stamp:
+                self._disk_cache[target_drive] = (stamp, cached[1] + size)
+
+    def _check_disk_space(self, zip_path, free) -> int:
+        # 按压缩包大小估算解压所需空间，free 不足时抛出 DiskSpaceError。
+        # 返回估算的解压后大小，供批量导入从剩余空间中扣减。
+        zip_size = os.path.getsize(zip_path)
+        # 估算解压后大小 (通常是压缩包的 2-3 倍，这里保守估计 3 倍)
+        estimated_size = zip_size * 3
+        # 需要至少 2 倍的估算空间作为安全余量 (解压过程可能产生临时文件)
+        required_space = estimated_size * 2
+
+        if free < required_space:
+            free_mb = free / (1024 * 1024)
+            required_mb = required_space / (1024 * 1024)
+            self.log(f"磁盘空间不足! 可用: {free_mb:.0f}MB, 需要: {required_mb:.0f}MB", "ERROR")
+            raise DiskSpaceError(f"磁盘空间不足 (需 {required_mb:.0f}MB)")
+        return estimated_size
+
+    def unzip_zips_to_library(self, progress_callback=None, password_provider=None, verify_crc=True):
         # 批量导入待解压区中的 ZIP/RAR 文件到语音包库，并通过回调输出总体进度。
+        # 各压缩包解压到互不相关的目录，预检后交由线程池并行解压。
         zips = self.scan_pending()
         if not zips:
             self.log("待解压区没有 ZIP/RAR 文件。", "WARN")
@@ -1010,170 +1359,441 @@ class LibraryManager:
         
         success_count = 0
         skipped_count = 0
-        
+
+        # 批量预检：磁盘可用空间只查询一次，之后按估算的解压大小逐个扣减；
+        # 库中已有的语音包名称一次性读入集合，避免逐个 exists()
+        try:
+            free_space = self._get_free_space()
+        except OSError as e:
+            free_space = None
+            self.log(f"磁盘空间检查失败 (跳过检查): {e}", "WARN")
+        try:
+            with os.scandir(self.library_dir) as it:
+                existing = {e.name for e in it if e.is_dir()}
+        except OSError:
+            existing = None
+
+        # 进度按每个压缩包的完成比例汇总；回调在锁内调用，保证多线程下进度单调
+        progress_lock = threading.Lock()
+        fractions = [0.0] * total
+
+        def report(idx, percent, msg):
+            with progress_lock:
+                fractions[idx] = max(fractions[idx], min(max(percent, 0), 100) / 100)
+                if progress_callback:
+                    progress_callback(sum(fractions) / total * 100, msg)
+
+        locked_provider = None
+        if password_provider:
+            def locked_provider(path, reason):
+                with self._password_lock:
+                    return password_provider(path, reason)
+
+        # 1. 串行预检：重复跳过、磁盘空间扣减、创建目标目录
+        tasks = []  # [(idx, zip_file, mod_name, target_dir), ...]
         for idx, zip_file in enumerate(zips):
+            mod_name = zip_file.stem
+            target_dir = self.library_dir / mod_name
             try:
-                mod_name = zip_file.stem
-                target_dir = self.library_dir / mod_name
-                
-                # 计算总体进度区间
-                base_progress = (idx / total) * 100
-                share_progress = (1 / total) * 100
-                
-                if target_dir.exists():
+                exists = (mod_name in existing) if existing is not None else target_dir.exists()
+
+                estimated_size = 0
+                if not exists and free_space is not None:
+                    try:
+                        estimated_size = self._check_disk_space(zip_file, free_space)
+                    except OSError as e:
+                        self.log(f"磁盘空间检查失败 (跳过检查): {e}", "WARN")
+
+                # 以 mkdir 的原子性兜底判断重复：扫描库目录之后才出现的同名目录（如同时进行的单个导入）同样跳过
+                if not exists:
+                    try:
+                        target_dir.mkdir()
+                    except FileExistsError:
+                        exists = True
+                if exists:
                     self.log(f"[SKIPPED] 跳过重复: {mod_name}", "WARN")
                     skipped_count += 1
-                    if progress_callback:
-                        progress_callback(base_progress + share_progress, f"跳过: {mod_name}")
+                    report(idx, 100, f"跳过: {mod_name}")
                     continue
-                
-                target_dir.mkdir()
-                self.log(f"[UNZIP] 正在解压 ({idx + 1}/{total}): {zip_file.name}", "UNZIP")
 
+                if free_space is not None:
+                    free_space -= estimated_size
+                if existing is not None:
+                    existing.add(mod_name)
+                tasks.append((idx, zip_file, mod_name, target_dir))
+            except Exception as e:
+                self.log(f"[ERROR] 解压 {zip_file.name} 失败: {e}", "ERROR")
+                report(idx, 100, f"失败: {mod_name}")
+
+        def import_one(idx, zip_file, mod_name, target_dir):
+            # 在工作线程中解压单个压缩包，返回 "success" / "skipped" / "failed"
+            self.log(f"[UNZIP] 正在解压 ({idx + 1}/{total}): {zip_file.name}", "UNZIP")
+            try:
                 self._extract_archive_with_password(
                     zip_file,
                     target_dir,
-                    progress_callback,
-                    base_progress,
-                    share_progress,
-                    password_provider=password_provider,
+                    lambda percent, msg: report(idx, percent, msg),
+                    0,
+                    100,
+                    password_provider=locked_provider,
+                    verify_crc=verify_crc,
                 )
-                self._normalize_wtlive_compat_files(target_dir)
-                
-                success_count += 1
+                self._normalize_wtlive_compat_files(target_dir, deep_search=True)
+                self._warm_mod_cache(mod_name)
                 self.log(f"[SUCCESS] 解压成功: {mod_name}", "SUCCESS")
+                return "success"
             except ArchivePasswordCanceled:
                 self.log(f"[WARN] 已取消输入密码，跳过: {zip_file.name}", "WARN")
-                if target_dir.exists():
-                    try: shutil.rmtree(target_dir)
-                    except: pass
-                if progress_callback:
-                    progress_callback(base_progress + share_progress, f"跳过: {mod_name}")
-                skipped_count += 1
+                result = "skipped"
             except Exception as e:
                 self.log(f"[ERROR] 解压 {zip_file.name} 失败: {e}", "ERROR")
-                if target_dir.exists():
-                    try: shutil.rmtree(target_dir)
-                    except: pass
+                result = "failed"
+            if target_dir.exists():
+                try: shutil.rmtree(target_dir)
+                except: pass
+            return result
+
+        # 2. 并行解压
+        if tasks:
+            workers = min(len(tasks), _BATCH_IMPORT_MAX_WORKERS, os.cpu_count() or 2)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futs = {ex.submit(import_one, *task): task for task in tasks}
+                for fut in as_completed(futs):
+                    idx, _, mod_name, _ = futs[fut]
+                    # 计数只在当前线程汇总，无需加锁
+                    result = fut.result()
+                    if result == "success":
+                        success_count += 1
+                    elif result == "skipped":
+                        skipped_count += 1
+                    if result != "success":
+                        report(idx, 100, f"跳过: {mod_name}")
 
         self.log(f"[INFO] 解压完成: 成功 {success_count}, 跳过 {skipped_count}", "INFO")
         if progress_callback: progress_callback(100, "全部完成")
 
-    def _extract_zip_safely(self, zip_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password=None):
+    def _extract_zip_safely(self, zip_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password=None, parallelism=None, verify_crc=True, zf=None):
         # 解压 ZIP 文件到目标目录，并提供进度回调与路径边界校验。
-        target_root = Path(target_dir).resolve()
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            file_list = zf.infolist()
-            total_files = len(file_list)
-            last_update = 0.0
-            extracted_bytes = 0
-            total_bytes = 0
+        # parallelism: 并行解压的线程数；None 表示按成员数量自动决定，1 表示串行。
+        # verify_crc: False 时跳过成员的 CRC-32 校验（仅用于受信任的压缩包）。
+        # zf: 调用方已打开的 ZipFile（由调用方负责关闭）；None 时在此打开 zip_path。
+        # 路径边界校验只做字符串规范化比较，不访问文件系统
+        target_root = os.path.normpath(str(target_dir))
+        target_prefix = os.path.join(target_root, "")
+        with (nullcontext(zf) if zf is not None else zipfile.ZipFile(zip_path, 'r')) as zf:
+            self._advise_sequential(zf)
+            # 中央目录只读取一次，并按原始文件名一次性分为目录成员与文件成员；
+            # macOS 资源分叉与 desktop.ini 直接在原始文件名上过滤（均为 ASCII，与解码无关）
+            dir_members, file_members = [], []
+            for m in zf.infolist():
+                name = m.filename
+                if "__MACOSX" in name or "desktop.ini" in name:
+                    continue
+                (dir_members if name.endswith("/") else file_members).append(m)
             if progress_callback:
                 try:
                     progress_callback(int(base_progress), f"开始解压: {Path(zip_path).name}")
                 except Exception:
                     pass
-            if total_files > 0:
-                for m in file_list:
-                    if m.is_dir():
-                        continue
-                    name = m.filename
-                    if "__MACOSX" in name or "desktop.ini" in name:
-                        continue
-                    try:
-                        total_bytes += int(getattr(m, "file_size", 0) or 0)
-                    except Exception:
-                        pass
-            
-            for idx, member in enumerate(file_list):
-                if idx % 50 == 0:
-                    time.sleep(0.001)
-                
-                try:
-                    filename = member.filename.encode('cp437').decode('utf-8')
-                except:
-                    try:
-                        filename = member.filename.encode('cp437').decode('gbk')
-                    except:
+
+            # 1. 预处理：解码文件名、路径边界校验
+            # 文件名编码按整个压缩包判定一次；无法统一判定时才逐个成员尝试
+            codec = self._detect_zip_name_codec(dir_members + file_members)
+            # 成员路径全程使用 str（不逐个构造 Path 对象），open/os.makedirs 均直接接受
+            dirs = set()  # 需要创建的目录（目录成员与文件的父目录）
+            rejected = []  # 越界的成员文件名，解析完成后合併为一条日誌
+            for member in dir_members:
+                filename, target_path = self._resolve_member_target(member, codec, target_root, target_prefix)
+                if target_path is None:
+                    rejected.append(filename)
+                    continue
+                dirs.add(target_path)
+
+            jobs = []  # [(member, filename, target_path), ...]
+            for member in file_members:
+                filename, target_path = self._resolve_member_target(member, codec, target_root, target_prefix)
+                if target_path is None:
+                    rejected.append(filename)
+                    continue
+                if member.flag_bits & 0x1 and not password:
+                    raise ArchivePasswordRequired("ZIP 需要密码")
+                jobs.append((member, filename, target_path))
+                dirs.add(os.path.dirname(target_path))
+
+            if rejected:
+                shown = ", ".join(rejected[:10])
+                more = f" 等 {len(rejected)} 个" if len(rejected) > 10 else ""
+                self.log(f"[WARN] 拦截恶意路径穿越文件: {shown}{more}", "WARN")
+
+            total_bytes = sum(m.file_size for m, _, _ in jobs)
+
+            # 2. 按深度由浅到深一次性创建目录树，解压时不再逐文件 mkdir，线程之间也不会竞争
+            for d in sorted(dirs, key=lambda p: p.count(os.sep)):
+                os.makedirs(d, exist_ok=True)
+
+            # 3. 解压
+            workers = parallelism
+            if workers is None:
+                workers = min(_PARALLEL_EXTRACT_MAX_WORKERS, os.cpu_count() or 1)
+                if len(jobs) < _PARALLEL_EXTRACT_MIN_FILES:
+                    # 成员较少时，仅当包含多个大文件才并行：zlib 解压期间释放 GIL，大成员可在线程间真正重叠
+                    big_members = sum(1 for m, _, _ in jobs if m.file_size >= _PARALLEL_EXTRACT_BIG_MEMBER)
+                    workers = min(workers, big_members) if big_members >= 2 else 1
+            workers = max(1, min(int(workers), len(jobs) or 1))
+
+            if workers == 1:
+                last_update = 0.0
+                extracted_bytes = 0
+                bytes_since_check = 0
+                for idx, (member, filename, target_path) in enumerate(jobs):
+                    should_push = (idx == 0) or (idx % 10 == 0) or (idx == len(jobs) - 1)
+                    now = time.monotonic() if progress_callback and should_push else 0.0
+                    if progress_callback and should_push and (now - last_update) >= 0.05:
+                        ratio = extracted_bytes / total_bytes if total_bytes > 0 else idx / len(jobs)
+                        current_percent = base_progress + ratio * share_progress
+                        fname = filename
+                        if len(fname) > 25:
+                            fname = "..." + fname[-25:]
                         try:
-                            filename = member.filename.encode('cp437').decode('cp950')
-                        except:
-                            filename = member.filename
-
-                if "__MACOSX" in filename or "desktop.ini" in filename: continue
-                
-                now = time.monotonic()
-                should_push = (idx == 0) or (idx % 10 == 0) or (idx == total_files - 1)
-                if progress_callback and total_files > 0 and should_push and (now - last_update) >= 0.05:
-                    ratio = idx / total_files
-                    current_percent = base_progress + ratio * share_progress
-                    fname = filename
-                    if len(fname) > 25:
-                        fname = "..." + fname[-25:]
-                    try:
-                        progress_callback(int(current_percent), f"解压中: {fname}")
-                    except Exception:
-                        pass
-                    last_update = now
-                
-                # 路径边界校验：目标路径必须位于 target_dir 内部
-                full_target_path = (target_dir / filename).resolve()
-                try:
-                    is_inside = os.path.commonpath([str(full_target_path), str(target_root)]) == str(target_root)
-                except Exception:
-                    is_inside = False
-                if not is_inside:
-                     self.log(f"[WARN] 拦截恶意路径穿越文件: {filename}", "WARN")
-                     continue
-
-                target_path = target_dir / filename
-                if member.is_dir():
-                    target_path.mkdir(parents=True, exist_ok=True)
-                else:
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    if member.flag_bits & 0x1 and not password:
-                        raise ArchivePasswordRequired("ZIP 需要密码")
-                    pwd = password.encode("utf-8") if password else None
-                    try:
-                        source_file = zf.open(member, pwd=pwd)
-                    except RuntimeError as e:
-                        msg = str(e).lower()
-                        if "password" in msg:
-                            if password:
-                                raise ArchivePasswordIncorrect("ZIP 密码错误")
-                            raise ArchivePasswordRequired("ZIP 需要密码")
-                        raise
-                    except Exception:
-                        raise
-                    with source_file as source, open(target_path, "wb") as target:
-                        chunk_size = 8192  # 8KB chunks
-                        while True:
-                            chunk = source.read(chunk_size)
-                            if not chunk:
-                                break
-                            target.write(chunk)
-                            if total_bytes > 0:
-                                extracted_bytes += len(chunk)
-                            now = time.monotonic()
-                            if progress_callback and total_files > 0 and (now - last_update) >= 0.2:
-                                if total_bytes > 0:
-                                    ratio = extracted_bytes / total_bytes
-                                else:
-                                    ratio = idx / total_files
-                                current_percent = base_progress + ratio * share_progress
-                                fname = filename
-                                if len(fname) > 25:
-                                    fname = "..." + fname[-25:]
-                                progress_callback(int(current_percent), f"解压中: {fname}")
-                                last_update = now
-            
+                            progress_callback(int(current_percent), f"解压中: {fname}")
+                        except Exception:
+                            pass
+                        last_update = now
+
+                    def _on_chunk(n, _filename=filename):
+                        nonlocal extracted_bytes, last_update, bytes_since_check
+                        extracted_bytes += n
+                        # 按字节数节流：每写入 _PROGRESS_CHECK_BYTES 才读取一次时钟
+                        bytes_since_check += n
+                        if bytes_since_check < _PROGRESS_CHECK_BYTES:
+                            return
+                        bytes_since_check = 0
+                        now = time.monotonic()
+                        if (now - last_update) >= 0.2:
+                            ratio = extracted_bytes / total_bytes if total_bytes > 0 else 0
+                            current_percent = base_progress + ratio * share_progress
+                            fname = _filename
+                            if len(fname) > 25:
+                                fname = "..." + fname[-25:]
+                            progress_callback(int(current_percent), f"解压中: {fname}")
+                            last_update = now
+
+                    self._extract_zip_member(
+                        zf, member, target_path, password,
+                        _on_chunk if progress_callback else None, verify_crc,
+                    )
+            else:
+                self._extract_zip_parallel(
+                    zip_path, jobs, workers, total_bytes, password,
+                    progress_callback, base_progress, share_progress, verify_crc,
+                )
+
             if progress_callback:
                 progress_callback(int(base_progress + share_progress), "解压完成")
 
+    def _resolve_member_target(self, member, codec, target_root, target_prefix):
+        # 解码 ZIP 成员文件名并计算规范化后的目标路径。
+        # 返回 (filename, full_target_path)；路径越出 target_root 时 full_target_path 为 None，由调用方汇总记录。
+        if member.flag_bits & _ZIP_FLAG_UTF8:
+            # 已声明 UTF-8 的文件名由 zipfile 正确解码
+            filename = member.filename
+        elif codec:
+            filename = member.filename.encode('cp437').decode(codec)
+        else:
+            filename = member.filename
+            raw_name = member.filename.encode('cp437')
+            for enc in _ZIP_NAME_CODECS:
+                try:
+                    filename = raw_name.decode(enc)
+                    break
+                except UnicodeDecodeError:
+                    continue
+
+        # 路径边界校验：目标路径必须位于 target_dir 内部
+        full_target_path = os.path.normpath(os.path.join(target_root, filename))
+        if full_target_path != target_root and not full_target_path.startswith(target_prefix):
+            return filename, None
+        return filename, full_target_path
+
+    def _advise_sequential(self, zf):
+        # 提示内核按顺序预读压缩包 (posix_fadvise SEQUENTIAL 会加大预读窗口)，减少解压时的同步读等待。
+        if not _HAS_FADVISE:
+            return
+        try:
+            os.posix_fadvise(zf.fp.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except (OSError, AttributeError, ValueError):
+            pass
+
+    def _detect_zip_name_codec(self, file_list):
+        # 判定压缩包中未声明 UTF-8 的文件名所用编码：依次尝试 _ZIP_NAME_CODECS，
+        # 返回能解码全部此类文件名的第一个编码；都不能时返回 None（由调用方逐个成员回退）。
+        raw = b"\0".join(
+            m.filename.encode('cp437') for m in file_list if not m.flag_bits & _ZIP_FLAG_UTF8
+        )
+        if not raw:
+            return None
+        for enc in _ZIP_NAME_CODECS:
+            try:
+                raw.decode(enc)
+                return enc
+            except UnicodeDecodeError:
+                continue
+        return None
+
+    def _extract_zip_member(self, zf, member, target_path, password, on_chunk=None, verify_crc=True):
+        # 解压单个 ZIP 成员到 target_path；on_chunk(n) 在每写入 n 字节后回调。
+        if (not verify_crc and _HAS_COPY_FILE_RANGE
+                and member.compress_type == zipfile.ZIP_STORED and not member.flag_bits & 0x1):
+            if self._copy_stored_member(zf, member, target_path, on_chunk):
+                return
+        if member.file_size == 0 and not member.flag_bits & 0x1:
+            # 空文件无需打开解压流，直接创建即可
+            open(target_path, "wb").close()
+            return
+        pwd = password.encode("utf-8") if password else None
+        try:
+            source_file = zf.open(member, pwd=pwd)
+        except RuntimeError as e:
+            msg = str(e).lower()
+            if "password" in msg:
+                if password:
+                    raise ArchivePasswordIncorrect("ZIP 密码错误")
+                raise ArchivePasswordRequired("ZIP 需要密码")
+            raise
+        if self._tune_member_stream(source_file, member, verify_crc):
+            try:
+                self._write_member_stream(source_file, member, target_path, on_chunk)
+            except isal_zlib.error as e:
+                # isal 的异常不是 zlib.error 的子类，这里还原为常规 zipfile 会抛出的类型
+                raise zlib.error(str(e)) from e
+            return
+        self._write_member_stream(source_file, member, target_path, on_chunk)
+
+    def _tune_member_stream(self, source_file, member, verify_crc):
+        # 对 ZipExtFile 私有属性的全部调整集中于此：跳过 CRC 校验、改用 isal 解压器。
+        # 仅在已核对的 Python 版本且实例上确有对应属性时修改，否则保持公开行为。
+        # 返回是否已改用 isal 解压器。
+        if not _ZIPEXTFILE_TUNABLE:
+            return False
+        if not verify_crc and hasattr(source_file, "_expected_crc"):
+            # ZipExtFile 在 _expected_crc 为 None 时不再逐块计算与比对 CRC-32
+            source_file._expected_crc = None
+        if (
+            isal_zlib is not None
+            and member.compress_type == zipfile.ZIP_DEFLATED
+            and hasattr(source_file, "_decompressor")
+        ):
+            # 安装了 isal 时仅替换本成员流的解压器（SIMD 加速的 ISA-L），不影响进程内其他 zipfile 使用者
+            source_file._decompressor = isal_zlib.decompressobj(-zlib.MAX_WBITS)
+            return True
+        return False
+
+    def _write_member_stream(self, source_file, member, target_path, on_chunk=None):
+        # 将已打开的 ZipExtFile 内容写到目标文件，并按块回报进度
+        if member.file_size <= _SMALL_MEMBER_SIZE:
+            # 小文件：一次 read() 解压全部内容（读到末尾时完成 CRC 校验），再一次写出
+            with source_file as source:
+                data = source.read()
+            with open(target_path, "wb") as target:
+                target.write(data)
+            if on_chunk:
+                on_chunk(len(data))
+            return
+        with source_file as source, open(target_path, "wb", buffering=_COPY_BUFFER_SIZE) as target:
+            if _HAS_FALLOCATE and member.file_size >= _PARALLEL_EXTRACT_BIG_MEMBER:
+                try:
+                    os.posix_fallocate(target.fileno(), 0, member.file_size)
+                except OSError:
+                    pass
+            dest = _ProgressWriter(target, on_chunk) if on_chunk else target
+            shutil.copyfileobj(source, dest, length=_COPY_BUFFER_SIZE)
+
+    def _copy_stored_member(self, zf, member, target_path, on_chunk=None):
+        # 未压缩 (ZIP_STORED) 的成员直接以 os.copy_file_range 从压缩包的数据区複製到目标文件，
+        # 不经过 Python 缓冲，也不计算 CRC（仅在 verify_crc=False 时使用）。
+        # 返回 False 表示当前环境/文件系统不支援，调用方应改用常规解压。
+        src_fd = zf.fp.fileno()
+        header = os.pread(src_fd, _ZIP_LOCAL_HEADER_SIZE, member.header_offset)
+        if len(header) != _ZIP_LOCAL_HEADER_SIZE or header[:4] != _ZIP_LOCAL_HEADER_SIG:
+            return False
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        offset = member.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_len + extra_len
+
+        remaining = member.file_size
+        with open(target_path, "wb") as target:
+            dst_fd = target.fileno()
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, min(remaining, _STORED_COPY_CHUNK), offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+                    remaining -= copied
+                    if on_chunk:
+                        on_chunk(copied)
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+                reported = member.file_size - remaining
+                if on_chunk and reported:
+                    # 调用方会整段重新解压并再次回报进度，先扣回已回报的字节，避免进度超出
+                    on_chunk(-reported)
+                return False
+        if remaining:
+            raise zipfile.BadZipFile(f"ZIP 成员数据不完整: {member.filename}")
+        return True
+
+    def _extract_zip_parallel(self, zip_path, jobs, workers, total_bytes, password, progress_callback=None, base_progress=0, share_progress=100, verify_crc=True):
+        # 将 ZIP 成员分组后交给线程池并行解压：每个线程持有独立的 ZipFile 句柄，互不干扰读取位置。
+        # 主线程轮询已解压字节数并推送进度。
+        chunks = [[] for _ in range(workers)]
+        chunk_sizes = [0] * workers
+        # 按大小从大到小分配给当前负载最小的分组，使各线程工作量接近
+        for job in sorted(jobs, key=lambda j: j[0].file_size, reverse=True):
+            i = chunk_sizes.index(min(chunk_sizes))
+            chunks[i].append(job)
+            chunk_sizes[i] += job[0].file_size
+        # 组内按成员在压缩包中的位置排序，使每个线程都顺序向前读取，配合顺序预读
+        for chunk in chunks:
+            chunk.sort(key=lambda j: j[0].header_offset)
+
+        counter_lock = threading.Lock()
+        extracted = [0]
+        abort = threading.Event()
+
+        def _on_chunk(n):
+            with counter_lock:
+                extracted[0] += n
+
+        def _worker(chunk):
+            with zipfile.ZipFile(zip_path, 'r') as zf:
+                self._advise_sequential(zf)
+                for member, _, target_path in chunk:
+                    if abort.is_set():
+                        return
+                    self._extract_zip_member(zf, member, target_path, password, _on_chunk, verify_crc)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unzip") as ex:
+            futures = [ex.submit(_worker, c) for c in chunks if c]
+            pending = set(futures)
+            try:
+                while pending:
+                    done, pending = wait(pending, timeout=0.2, return_when=FIRST_EXCEPTION)
+                    for fut in done:
+                        if fut.exception() is not None:
+                            raise fut.exception()
+                    if progress_callback and total_bytes > 0:
+                        with counter_lock:
+                            ratio = extracted[0] / total_bytes
+                        progress_callback(int(base_progress + ratio * share_progress), f"解压中: {Path(zip_path).name}")
+            except BaseException:
+                abort.set()
+                raise
+
     def copy_country_files(self, mod_name, game_path, country_code, include_ground=True, include_radio=True):
         # 从语音包库中复制“陆战/无线电”国籍语音文件到游戏 sound/mod，并将文件名中的国家缩写替换为目标缩写。
         code = str(country_code or "").strip().lower()
-        if not code or not re.match(r"^[a-z]{2,10}$", code):
+        if not code or not _COUNTRY_CODE_RE.match(code):
             raise ValueError("国家缩写不合法")
         if code == "zh":
             raise ValueError("目标国家缩写不能为 zh")
@@ -1190,19 +1810,21 @@ class LibraryManager:
         skipped = []
         missing = []
 
+        # 语音包目录只遍历一次，收集全部 .bank 文件 (路径, 文件名) 供各次查找复用
+        bank_files = [
+            (entry.path, entry.name)
+            for entry, _, _ in self._iter_files_scandir(mod_dir)
+            if entry.name.lower().endswith(".bank")
+        ]
+
         def _find_source(prefix, suffix):
-            matches = []
             prefix_clean = prefix.lstrip("_")
             pattern = re.compile(
                 rf"^_?{re.escape(prefix_clean)}([a-z]{{2,10}})?{re.escape(suffix)}$",
                 re.IGNORECASE,
             )
-            for p in mod_dir.rglob("*"):
-                if p.is_file() and pattern.match(p.name):
-                    matches.append(p)
-            if not matches:
-                return None
-            return sorted(matches, key=lambda x: str(x))[0]
+            best = min((path for path, name in bank_files if pattern.match(name)), default=None)
+            return Path(best) if best else None
 
         def _copy_pair(prefix):
             src_assets_name = f"{prefix}*.assets.bank"
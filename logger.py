@@ -12,14 +12,17 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import queue
 import sys
 import threading
 import traceback
 from collections.abc import Callable
 from contextlib import contextmanager
-from functools import wraps
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, TypeVar, ParamSpec
 
@@ -28,6 +31,10 @@ APP_LOGGER_NAME = "WT_Voice_Manager"
 _ui_callback: Callable[[str, logging.LogRecord], None] | None = None
 _ui_emit_guard = threading.local()
 
+# 已完成配置的日誌记录器 (名称 -> Logger)，get_logger 命中后直接返回
+_configured_loggers: dict[str, logging.Logger] = {}
+_setup_lock = threading.Lock()
+
 # 类型变数用于装饰器
 P = ParamSpec('P')
 T = TypeVar('T')
@@ -66,6 +73,28 @@ class UiCallbackHandler(logging.Handler):
             _ui_emit_guard.active = False
 
 
+class _UiQueueHandler(QueueHandler):
+    """
+    将发往 UI 的日誌记录放入队列，由 QueueListener 的后台线程调用 UI 回调。
+
+    记录日誌的线程只需入队即可返回，不会被前端调用（evaluate_js 等）阻塞。
+    UI 回调执行期间产生的日誌（例如推送失败的异常）不再入队，避免循环推送。
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _ui_callback is None or getattr(_ui_emit_guard, "active", False):
+            return
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 同进程内传递：只固定消息参数，保留 exc_info 供 UI 格式化器输出堆栈，
+        # 不像默认实现那样把堆栈併入消息正文（前端 Toast 只显示消息本身）
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class ContextLogger:
     """
     带上下文的日誌记录器，用于追踪操作流程。
@@ -193,6 +222,7 @@ def format_exception(e: Exception, include_traceback: bool = False) -> str:
     return msg
 
 
+@lru_cache(maxsize=1)
 def _get_log_dir() -> Path:
     """获取日誌存储目录，确保目录存在。"""
     from utils import get_docs_data_dir
@@ -222,6 +252,20 @@ def setup_logger(name: str = APP_LOGGER_NAME) -> logging.Logger:
     Returns:
         配置好的 Logger 实例
     """
+    logger = _configured_loggers.get(name)
+    if logger is not None:
+        return logger
+
+    with _setup_lock:
+        logger = _configured_loggers.get(name)
+        if logger is None:
+            logger = _configure_logger(name)
+            _configured_loggers[name] = logger
+    return logger
+
+
+def _configure_logger(name: str) -> logging.Logger:
+    """为指定名称的 Logger 添加文件、控制台与 UI 处理器（仅在首次 setup_logger 时调用）。"""
     logger = logging.getLogger(name)
     
     # 防止重複添加 handler
@@ -273,11 +317,18 @@ def setup_logger(name: str = APP_LOGGER_NAME) -> logging.Logger:
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
-    # 3. UI 处理器（回调为空时不输出）
+    # 3. UI 处理器（回调为空时不输出）：经队列交给后台线程推送，记录日誌的线程不等待前端
     ui_handler = UiCallbackHandler()
     ui_handler.setLevel(logging.INFO)
     ui_handler.setFormatter(ui_formatter)
-    logger.addHandler(ui_handler)
+    ui_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _UiQueueHandler(ui_queue)
+    queue_handler.setLevel(logging.INFO)
+    logger.addHandler(queue_handler)
+    listener = QueueListener(ui_queue, ui_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.ui_listener = listener  # type: ignore[attr-defined]
     
     logger.info(f"日誌系统初始化完成，日誌路径: {log_dir}")
     
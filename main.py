@@ -3,13 +3,18 @@ import argparse
 import base64
 import itertools
 import json
+import logging
+import mmap
 import os
-import random
 import sys
 import threading
 import time
 import platform
+import queue
+import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait
 try:
     import webview
 except Exception as _e:
@@ -17,12 +22,9 @@ except Exception as _e:
     _WEBVIEW_IMPORT_ERROR = _e
 
 from pathlib import Path
+from typing import Iterator, NoReturn
 from config_manager import ConfigManager
-from core_logic import CoreService
-from library_manager import ArchivePasswordCanceled, LibraryManager
 from logger import setup_logger, get_logger, set_ui_callback
-from sights_manager import SightsManager
-from skins_manager import SkinsManager
 
 AGREEMENT_VERSION = "2026-01-10"
 
@@ -35,6 +37,35 @@ WEB_DIR = BASE_DIR / "web"
 
 log = get_logger(__name__)
 
+# 日志消息开头的自定义标签，如 [SUCCESS] / [WARN]
+_LOG_TAG_RE = re.compile(r"^\s*\[(SUCCESS|WARN|ERROR|INFO|SYS)\]")
+
+# 前端 Toast 类型映射：消息自定义标签优先，其次按 logging 级别名
+_TOAST_LEVEL_BY_TAG = {
+    sys.intern("SUCCESS"): "SUCCESS",
+    sys.intern("WARN"): "WARN",
+    sys.intern("ERROR"): "ERROR",
+}
+_TOAST_LEVEL_BY_LEVELNAME = {
+    sys.intern("WARNING"): "WARN",
+    sys.intern("ERROR"): "ERROR",
+}
+
+# 前端事件合并推送窗口（秒）：窗口内的日志/进度合并为一次 evaluate_js
+_UI_FLUSH_INTERVAL = 0.04
+
+# 连续出现时只需保留最后一条的前端事件（进度类，后一条会覆盖前一条）
+_UI_COALESCE_FNS = frozenset({"updateSearchLog", "loading.update"})
+
+# 前端调用参数的 JSON 编码器（预先构造，避免每次 json.dumps 重新组装编码器）
+_JS_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+
+# 默认语音包封面：web 目录内的静态资源，前端按相对 URL 直接加载，无需 base64 内嵌
+_DEFAULT_MOD_COVER_URL = "assets/card_image.png"
+
+# 自动搜索期间前端旋转指示的刷新间隔（秒）
+_SEARCH_SPINNER_INTERVAL = 0.15
+
 
 def _show_fatal_error(title: str, message: str) -> None:
     """显示致命错误（尽量用系统对话框，失败则退回 stderr）。"""
@@ -94,6 +125,36 @@ def _install_global_exception_handlers() -> None:
         threading.excepthook = _thread_excepthook
 
 
+def _log_task_error(future) -> None:
+    """记录线程池任务中未捕获的例外（线程池内的例外不会触发 threading.excepthook）。"""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is None:
+        return
+    try:
+        get_logger("thread").critical(
+            "背景任务未捕捉例外", exc_info=(type(exc), exc, exc.__traceback__)
+        )
+    except Exception:
+        pass
+
+
+def _exit_process(code: int) -> NoReturn:
+    """窗口关闭并释放资源后直接结束进程。
+
+    后台线程池的工作线程不是守护线程，正常退出时直译器会等待进行中的导入/安装/还原任务跑完，
+    使进程在窗口消失后仍残留；这里先刷新日志再以 os._exit 结束，与 close_window 的处理一致。
+    """
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except Exception:
+        pass
+    logging.shutdown()
+    os._exit(code)
+
+
 def _windows_has_webview2_runtime() -> bool:
     """粗略检查 Windows 是否安装 WebView2 Runtime。
 
@@ -137,6 +198,26 @@ def _open_url(url: str) -> None:
         pass
 
 
+def _iter_file_names(root) -> Iterator[str]:
+    """以 os.scandir 遍历目录树，只产出文件名（语义同 os.walk：不进入符号链接目录）。"""
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    else:
+                        yield entry.name
+                except OSError:
+                    continue
+
+
 def _parse_cli_args(argv: list[str] | None = None) -> argparse.Namespace:
     """解析启动参数（不使用环境变数）。"""
     if argv is None:
@@ -173,9 +254,23 @@ class AppApi:
         # 加下划线表示私有变量，pywebview 就不会尝试去扫描和序列化整个窗口对象，
         # 从而避免了 "window.native... maximum recursion depth" 错误。
         self._window = None
+        # evaluate_js 跨线程调用串行化，避免多个后台线程同时等待 JS 返回值
+        self._js_lock = threading.Lock()
+        # 窗口开始关闭后置位：后台线程据此停止向前端推送，避免与关闭流程互相等待而卡死
+        self._closing = threading.Event()
+
+        # 前端事件队列：日志、Toast 与进度由调度线程合并后批量推送
+        self._evt_queue = queue.Queue()
+        self._dispatcher_thread = None
 
         # 管理器实例：配置、语音包库、涂装、炮镜、游戏目录操作
         # 注意：所有管理器现在统一使用 logger.py 的日誌系统
+        # 业务模块延迟到此处导入：模块载入时不拖慢启动检查，且导入失败也会经由全局例外处理写入日志
+        from core_logic import CoreService
+        from library_manager import LibraryManager
+        from sights_manager import SightsManager
+        from skins_manager import SkinsManager
+
         self._cfg_mgr = ConfigManager()
         
         # 从配置读取自定义路径
@@ -197,9 +292,79 @@ class AppApi:
         self._password_value = None
         self._password_cancelled = False
 
+        # 后台任务线程池：复用工作线程执行搜索/导入/安装/还原等耗时操作，避免每次点击都新建线程
+        self._worker_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aimer-worker")
+
+        # 语音包封面 data URL 缓存：按 (路径, mtime) 复用编码结果
+        self._cover_cache = {}
+        # 主题列表缓存：文件名 -> (mtime, 主题元信息)，文件未变化时不重新解析
+        self._theme_cache = {}
+
     def set_window(self, window):
         # 绑定 PyWebview Window 实例到桥接层，供后续 API 调用使用。
         self._window = window
+        if self._dispatcher_thread is None:
+            self._dispatcher_thread = threading.Thread(
+                target=self._dispatch_ui_events, name="ui-dispatcher", daemon=True
+            )
+            self._dispatcher_thread.start()
+        try:
+            window.events.closing += self._on_window_closing
+        except Exception:
+            log.debug("绑定窗口关闭事件失败", exc_info=True)
+
+    def _on_window_closing(self):
+        # 窗口关闭事件回调：仅置位关闭标志，不取消关闭。
+        self._closing.set()
+
+    def _eval(self, js):
+        # 所有 evaluate_js 调用的统一入口：加锁串行执行；窗口未绑定或已关闭时直接忽略。
+        # 注意不要在此写日志：日志推送本身也经由这里，失败时会形成回环。
+        window = self._window
+        if window is None or self._closing.is_set() or not getattr(webview, "windows", None):
+            return None
+        with self._js_lock:
+            try:
+                return window.evaluate_js(js)
+            except Exception:
+                return None
+
+    def _submit(self, fn, *args):
+        # 将后台任务提交到工作线程池，并为其挂上异常日志回调。
+        future = self._worker_pool.submit(fn, *args)
+        future.add_done_callback(_log_task_error)
+        return future
+
+    def _call_js(self, fn, *args):
+        # 直接调用前端函数 fn(*args)：参数以 JSON 编码传入；函数不存在时静默跳过。
+        args_js = ", ".join(map(_JS_ENCODE, args))
+        return self._eval(f"if(typeof {fn} === 'function') {fn}({args_js})")
+
+    def _push_ui(self, fn, *args):
+        # 将一次前端调用放入事件队列，由调度线程按顺序合并推送。
+        if self._window and not self._closing.is_set():
+            self._evt_queue.put((fn, args))
+
+    def _dispatch_ui_events(self):
+        # 调度线程：等待首个事件后收集一个合并窗口内的全部事件，以一次 evaluate_js 交给前端 app._drainLogs。
+        while True:
+            events = [self._evt_queue.get()]
+            time.sleep(_UI_FLUSH_INTERVAL)
+            while True:
+                try:
+                    events.append(self._evt_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # 连续的进度类事件只保留最后一条，其余事件保持原有顺序
+            batch = []
+            for fn, args in events:
+                if batch and fn in _UI_COALESCE_FNS and batch[-1][0] == fn:
+                    batch[-1] = [fn, args]
+                else:
+                    batch.append([fn, args])
+
+            self._call_js("app._drainLogs", batch)
 
     def _load_json_with_fallback(self, file_path):
         # 按编码回退策略读取 JSON 文件并解析为 Python 对象。
@@ -220,14 +385,9 @@ class AppApi:
         if not self._window:
             return
         
-        # 1. 追加日志到面板
-        try:
-            safe_msg = formatted_message.replace("\r", "").replace("\n", "<br>")
-            msg_js = json.dumps(safe_msg, ensure_ascii=True)
-            self._window.evaluate_js(f"if(window.app && app.appendLog) app.appendLog({msg_js})")
-        except Exception:
-            # 避免在日志回调中抛异常导致业务中断
-            log.exception("日志推送失败")
+        # 1. 追加日志到面板（入队，由调度线程批量推送）
+        safe_msg = formatted_message.replace("\r", "").replace("\n", "<br>")
+        self._push_ui("appendLog", safe_msg)
 
         # 2. 处理 Toast 通知
         # 我们可以根据 record.message 或 record.levelname 判断是否弹窗。
@@ -240,24 +400,12 @@ class AppApi:
 
             # 兼容：从消息内容解析 [SUCCESS] / [WARN] / [ERROR] 等标签
             # 如果消息里显式写了 [SUCCESS]，我们认为它是 SUCCESS 级别
-            import re
-            match = re.search(r"^\s*\[(SUCCESS|WARN|ERROR|INFO|SYS)\]", msg_content)
+            match = _LOG_TAG_RE.search(msg_content)
             custom_tag = match.group(1) if match else None
 
-            # 映射到前端 Toast 类型
-            toast_level = None
-            
-            if custom_tag == "SUCCESS":
-                toast_level = "SUCCESS"
-            elif custom_tag in ("WARN", "WARNING"):
-                toast_level = "WARN"
-            elif custom_tag == "ERROR":
-                toast_level = "ERROR"
-            elif level_key == "WARNING":
-                toast_level = "WARN"
-            elif level_key == "ERROR":
-                toast_level = "ERROR"
-            
+            # 映射到前端 Toast 类型（查表，标签未命中时回退到日志级别）
+            toast_level = _TOAST_LEVEL_BY_TAG.get(custom_tag) or _TOAST_LEVEL_BY_LEVELNAME.get(level_key)
+
             # 如果有对应的 Toast 级别，则推送
             if toast_level:
                 # 去除换行
@@ -265,9 +413,7 @@ class AppApi:
                 # 去除可能的标签前缀 (可选，保留也无妨，前端只是显示文本)
                 # msg_plain = re.sub(r"^\s*\[(SUCCESS|WARN|ERROR|INFO|SYS)\]\s*", "", msg_plain)
 
-                msg_plain_js = json.dumps(msg_plain, ensure_ascii=True)
-                level_js = json.dumps(toast_level, ensure_ascii=True)
-                self._window.evaluate_js(f"if(window.app && app.notifyToast) app.notifyToast({level_js}, {msg_plain_js})")
+                self._push_ui("notifyToast", toast_level, msg_plain)
 
         except Exception:
             pass
@@ -281,9 +427,7 @@ class AppApi:
                 except Exception as e:
                     log.error(f"置顶设置失败: {e}")
 
-        t = threading.Thread(target=_update_topmost)
-        t.daemon = True
-        t.start()
+        self._submit(_update_topmost)
         return True
 
     def drag_window(self):
@@ -314,6 +458,7 @@ class AppApi:
         if not core_ready:
             os._exit(0)
 
+        self._closing.set()
         self._window.destroy()
 
     # --- 核心业务 API (供 JS 调用) ---
@@ -361,7 +506,7 @@ class AppApi:
         # 打开目录选择对话框，获取用户选择的游戏根目录并进行校验与保存。
         folder = self._window.create_file_dialog(webview.FileDialog.FOLDER)
         if folder and len(folder) > 0:
-            path = folder[0].replace(os.sep, "/")
+            path = Path(folder[0]).as_posix()
             valid, msg = self._logic.validate_game_path(path)
             if valid:
                 self._cfg_mgr.set_game_path(path)
@@ -380,96 +525,96 @@ class AppApi:
 
         def _run():
             log.debug("检索引擎初始化...")
-            time.sleep(0.3)
-
-            # 执行路径搜索
-            found_path = self._logic.auto_detect_game_path()
 
-            # 通过节流减少前端更新频率
+            # 真实的路径搜索交给核心服务线程池执行，本线程只按固定间隔刷新旋转指示，搜索结束即停止；
+            # 窗口关闭标志同时作为取消信号，使全盘扫描随之中止
             spinner = itertools.cycle(["|", "/", "—", "\\"])
-            progress = 0
-            update_interval = 0.15  # 每150ms更新一次UI
-            last_update = time.time()
-
-            while progress < 100:
-                step = random.randint(3, 8)
-                if 30 < progress < 50:
-                    time.sleep(random.uniform(0.15, 0.25))
-                    step = random.randint(8, 15)
-                elif 80 < progress < 90:
-                    time.sleep(random.uniform(0.25, 0.45))
-                    step = 2
-                else:
-                    time.sleep(0.08)
-
-                progress += step
-                if progress > 100:
-                    progress = 100
-
-                # 只在达到更新间隔或完成时推送一次进度文本
-                current_time = time.time()
-                if current_time - last_update >= update_interval or progress >= 100:
-                    char = next(spinner)
-                    msg_js = json.dumps(
-                        f"[扫描] 正在检索存储设备... [{char}] {progress}%",
-                        ensure_ascii=False,
-                    )
-                    self._window.evaluate_js(f"app.updateSearchLog({msg_js})")
-                    last_update = current_time
+            future = self._logic.start_search_thread(cancel_event=self._closing)
+            while True:
+                # 窗口关闭中：不再等待搜索结果，也不再写配置或通知前端
+                if self._closing.is_set():
+                    self._search_running = False
+                    return
+                self._push_ui(
+                    "updateSearchLog", f"[扫描] 正在检索存储设备... [{next(spinner)}]"
+                )
+                done, _ = wait((future,), timeout=_SEARCH_SPINNER_INTERVAL)
+                if done:
+                    break
+
+            try:
+                found_path = future.result()
+            except Exception:
+                # 异常已由 start_search_thread 的完成回调记录
+                found_path = None
+            self._push_ui("updateSearchLog", "[扫描] 存储设备检索完成 100%")
 
-            time.sleep(0.3)
             if found_path:
                 self._cfg_mgr.set_game_path(found_path)
                 self._logic.validate_game_path(found_path)
                 log.info("[SUCCESS] 自动搜索成功，路径已保存。")
 
                 # 通知前端更新 UI
-                path_js = json.dumps(found_path.replace(os.sep, "/"), ensure_ascii=False)
-                self._window.evaluate_js(f"app.onSearchSuccess({path_js})")
+                self._push_ui("onSearchSuccess", Path(found_path).as_posix())
             else:
                 log.error("深度扫描未发现游戏客户端。")
-                self._window.evaluate_js("app.onSearchFail()")
+                self._push_ui("onSearchFail")
             self._search_running = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._submit(_run)
+
+    def _cover_data_url(self, cover_path):
+        # 将封面图片转为 data URL；按 (路径, mtime) 缓存，文件未变化时直接复用编码结果。
+        cover_path = str(cover_path)
+        try:
+            mtime = os.stat(cover_path).st_mtime_ns
+        except OSError:
+            return ""
+        cached = self._cover_cache.get(cover_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            ext = os.path.splitext(cover_path)[1].lower().replace(".", "")
+            if ext == "jpg":
+                ext = "jpeg"
+            # 以内存映射直接编码，避免先把整张图片读入 bytes 再编码；base64 输出为纯 ASCII
+            with open(cover_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    b64_data = ""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        b64_data = base64.b64encode(mm).decode("ascii")
+            url = f"data:image/{ext};base64,{b64_data}"
+        except Exception as e:
+            log.error(f"图片转码失败: {e}")
+            return ""
+        self._cover_cache[cover_path] = (mtime, url)
+        return url
+
+    def _build_mod_entry(self, item):
+        # 为单个语音包补充封面 URL 与 ID，返回前端渲染所需的详情字典。
+        mod, details = item
+        # 封面选择：优先使用语音包提供的封面，缺失或不可读时使用默认封面的静态 URL
+        cover_path = details.get("cover_path")
+        cover_url = self._cover_data_url(cover_path) if cover_path else ""
+        details["cover_url"] = cover_url or _DEFAULT_MOD_COVER_URL
+
+        # 补充 ID
+        details["id"] = mod
+        return details
 
     def get_library_list(self, opts=None):
-        # 扫描语音包库并返回每个语音包的详情列表，包含封面 data URL 以便前端直接渲染。
+        # 扫描语音包库并返回每个语音包的详情列表；自带封面为 data URL，默认封面为静态资源 URL。
         t0 = time.perf_counter() if self._perf_enabled else None
-        mods = self._lib_mgr.scan_library()
-        result = []
-
-        # 默认封面路径（当语音包未提供封面或封面文件不存在时使用）
-        default_cover_path = WEB_DIR / "assets" / "card_image.png"
-
-        for mod in mods:
-            details = self._lib_mgr.get_mod_details(mod)
+        items = list(self._lib_mgr.scan_library_with_details().items())
 
-            # 1. 获取作者提供的封面路径
-            cover_path = details.get("cover_path")
-            details["cover_url"] = ""
-
-            # 封面路径选择：优先使用语音包提供的封面，否则使用默认封面
-            if not cover_path or not os.path.exists(cover_path):
-                cover_path = str(default_cover_path)
-
-            # 封面图片读取并转为 data URL
-            if cover_path and os.path.exists(cover_path):
-                try:
-                    ext = os.path.splitext(cover_path)[1].lower().replace(".", "")
-                    if ext == "jpg":
-                        ext = "jpeg"
-                    with open(cover_path, "rb") as f:
-                        b64_data = base64.b64encode(f.read()).decode("utf-8")
-                        details["cover_url"] = f"data:image/{ext};base64,{b64_data}"
-                except Exception as e:
-                    log.error(f"图片转码失败: {e}")
-            
-            # 补充 ID
-            details["id"] = mod
-            result.append(details)
+        # 各语音包的封面读取与编码相互独立（文件读取与 b64encode 期间释放 GIL），并行处理
+        workers = min(16, len(items))
+        if workers <= 1:
+            result = [self._build_mod_entry(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mod-cover") as ex:
+                result = list(ex.map(self._build_mod_entry, items))
         if self._perf_enabled and t0 is not None:
             dt_ms = (time.perf_counter() - t0) * 1000.0
             log.debug(f"[PERF] get_library_list {dt_ms:.1f}ms mods={len(result)}")
@@ -485,9 +630,10 @@ class AppApi:
             path = self._cfg_mgr.get_game_path()
             if path and os.path.exists(path):
                 try:
-                    if platform.system() == "Windows":
+                    system = platform.system()
+                    if system == "Windows":
                         os.startfile(path)
-                    elif platform.system() == "Darwin":
+                    elif system == "Darwin":
                         subprocess.Popen(["open", path])
                     else:
                         subprocess.Popen(["xdg-open", path])
@@ -512,18 +658,23 @@ class AppApi:
 
     # --- 辅助方法 ---
     def update_loading_ui(self, progress, message):
-        # 将进度与提示文本推送到前端加载组件 MinimalistLoading。
+        # 将进度与提示文本推送到前端加载组件 MinimalistLoading（经事件队列合并推送）。
         if self._window:
             try:
                 safe_msg = str(message).replace("\r", " ").replace("\n", " ")
                 safe_progress = max(0, min(100, int(progress)))
-                msg_js = json.dumps(safe_msg, ensure_ascii=True)
-                self._window.evaluate_js(
-                    f"if(window.MinimalistLoading) MinimalistLoading.update({safe_progress}, {msg_js})"
-                )
+                self._push_ui("loading.update", safe_progress, safe_msg)
             except Exception as e:
                 log.error(f"Loading UI 更新失败: {e}")
 
+    def _show_loading_ui(self, message):
+        # 显示前端加载组件（关闭自动模拟，由后端推送真实进度），与进度更新共用事件队列以保证顺序。
+        self._push_ui("loading.show", False, str(message))
+
+    def _hide_loading_ui(self):
+        # 隐藏前端加载组件。
+        self._push_ui("loading.hide")
+
     def submit_archive_password(self, password):
         # 接收前端输入的压缩包密码，并唤醒等待中的解压线程。
         with self._password_lock:
@@ -548,9 +699,7 @@ class AppApi:
             self._password_event.clear()
             self._password_value = None
             self._password_cancelled = False
-        name_js = json.dumps(str(archive_name or ""), ensure_ascii=False)
-        err_js = json.dumps(str(error_hint or ""), ensure_ascii=False)
-        self._window.evaluate_js(f"app.openArchivePasswordModal({name_js}, {err_js})")
+        self._push_ui("openArchivePasswordModal", str(archive_name or ""), str(error_hint or ""))
         self._password_event.wait()
         with self._password_lock:
             if self._password_cancelled:
@@ -566,13 +715,12 @@ class AppApi:
 
         # 显示加载组件（关闭自动模拟，由后端推送真实进度）
         if self._window:
-            msg_js = json.dumps("正在准备导入...", ensure_ascii=False)
-            self._window.evaluate_js(
-                f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
-            )
+            self._show_loading_ui("正在准备导入...")
             self.update_loading_ui(1, "开始扫描待解压区...")
 
         def _run():
+            from library_manager import ArchivePasswordCanceled
+
             try:
                 def password_provider(archive_path, reason):
                     hint = "密码错误，请重试" if reason == "incorrect" else ""
@@ -585,30 +733,20 @@ class AppApi:
 
                 # 完成后通知前端刷新列表
                 if self._window:
-                    self._window.evaluate_js("app.refreshLibrary()")
-                    msg_js = json.dumps("导入完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_ui("refreshLibrary")
+                    self.update_loading_ui(100, "导入完成")
             except ArchivePasswordCanceled:
                 log.warning("已取消输入密码，导入已终止")
                 if self._window:
-                    self._window.evaluate_js(
-                        "if(window.MinimalistLoading) MinimalistLoading.hide()"
-                    )
+                    self._hide_loading_ui()
             except Exception as e:
                 log.error(f"导入失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("导入失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self.update_loading_ui(100, "导入失败")
             finally:
                 self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        self._submit(_run)
 
     def import_selected_zip(self):
         # 打开文件选择对话框导入单个 ZIP/RAR 到语音包库，并将进度同步到前端加载组件。
@@ -637,14 +775,11 @@ class AppApi:
 
             # 显示加载条
             if self._window:
-                msg_js = json.dumps(
-                    f"准备导入: {Path(zip_path).name}", ensure_ascii=False
-                )
-                self._window.evaluate_js(
-                    f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
-                )
+                self._show_loading_ui(f"准备导入: {Path(zip_path).name}")
 
             def _run():
+                from library_manager import ArchivePasswordCanceled
+
                 try:
                     self.update_loading_ui(1, f"正在读取: {Path(zip_path).name}")
 
@@ -660,30 +795,20 @@ class AppApi:
 
                     # 完成后通知前端刷新列表
                     if self._window:
-                        self._window.evaluate_js("app.refreshLibrary()")
-                        msg_js = json.dumps("导入完成", ensure_ascii=False)
-                        self._window.evaluate_js(
-                            f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                        )
+                        self._push_ui("refreshLibrary")
+                        self.update_loading_ui(100, "导入完成")
                 except ArchivePasswordCanceled:
                     log.warning("已取消输入密码，导入已终止")
                     if self._window:
-                        self._window.evaluate_js(
-                            "if(window.MinimalistLoading) MinimalistLoading.hide()"
-                        )
+                        self._hide_loading_ui()
                 except Exception as e:
                     log.error(f"导入失败: {e}")
                     if self._window:
-                        msg_js = json.dumps("导入失败", ensure_ascii=False)
-                        self._window.evaluate_js(
-                            f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                        )
+                        self.update_loading_ui(100, "导入失败")
                 finally:
                     self._is_busy = False
 
-            t = threading.Thread(target=_run)
-            t.daemon = True
-            t.start()
+            self._submit(_run)
         else:
             pass
 
@@ -748,10 +873,7 @@ class AppApi:
         self._is_busy = True
 
         if self._window:
-            msg_js = json.dumps(f"涂装解压: {Path(zip_path).name}", ensure_ascii=False)
-            self._window.evaluate_js(
-                f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
-            )
+            self._show_loading_ui(f"涂装解压: {Path(zip_path).name}")
 
         def _run():
             try:
@@ -759,31 +881,20 @@ class AppApi:
                     zip_path, path, progress_callback=self.update_loading_ui
                 )
                 if self._window:
-                    self._window.evaluate_js("if(app.refreshSkins) app.refreshSkins()")
-                    msg_js = json.dumps("涂装导入完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_ui("refreshSkins")
+                    self.update_loading_ui(100, "涂装导入完成")
             except FileExistsError as e:
                 log.warning(f"{e}")
                 if self._window:
-                    msg_js = json.dumps(str(e), ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self.update_loading_ui(100, str(e))
             except Exception as e:
                 log.error(f"涂装导入失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("涂装导入失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self.update_loading_ui(100, "涂装导入失败")
             finally:
                 self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._submit(_run)
         return True
 
     def rename_skin(self, old_name, new_name):
@@ -855,36 +966,34 @@ class AppApi:
         # 记录当前语音包标识，供前端在列表中标记已生效项
         self._cfg_mgr.set_current_mod(mod_name)
 
-        def _run():
+        def _on_done(future):
+            # 安装任务在核心服务线程池执行，结束后于完成回调中通知前端并释放忙碌状态
             try:
-                mod_path = self._lib_mgr.library_dir / mod_name
-                self._logic.install_from_library(
-                    mod_path, install_list, progress_callback=self.update_loading_ui
-                )
+                future.result()
 
                 # 安装完成，通知前端
                 if self._window:
-                    self._window.evaluate_js(
-                        f"if(app.onInstallSuccess) app.onInstallSuccess('{mod_name}')"
-                    )
-                    msg_js = json.dumps("安装完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_ui("onInstallSuccess", mod_name)
+                    self.update_loading_ui(100, "安装完成")
             except Exception as e:
                 log.error(f"安装失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("安装失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self.update_loading_ui(100, "安装失败")
             finally:
                 with self._lock:
                     self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        try:
+            mod_path = self._lib_mgr.library_dir / mod_name
+            future = self._logic.start_install_task(
+                mod_path, install_list, progress_callback=self.update_loading_ui
+            )
+        except Exception as e:
+            log.error(f"安装失败: {e}")
+            with self._lock:
+                self._is_busy = False
+            return False
+        future.add_done_callback(_on_done)
         return True
 
     def check_install_conflicts(self, mod_name, install_list):
@@ -907,17 +1016,14 @@ class AppApi:
             if not mod_path.exists():
                 return []
 
-            # 遍历将要安装的目录集合，收集目标文件名列表
-            files_to_install = []
+            # 遍历将要安装的目录集合，收集目标文件名集合（同名文件只需检查一次）
+            files_to_install = set()
             for folder_rel_path in install_list:
                 if folder_rel_path == "根目录":
                     src_dir = mod_path
                 else:
                     src_dir = mod_path / folder_rel_path
-                if src_dir.exists():
-                    for root, dirs, files in os.walk(src_dir):
-                        for file in files:
-                            files_to_install.append(file)
+                files_to_install.update(_iter_file_names(src_dir))
 
             # 调用 manifest_mgr 进行冲突检测
             if self._logic.manifest_mgr:
@@ -933,14 +1039,11 @@ class AppApi:
             log.warning("另一个任务正在进行中，请稍候...")
             return False
 
-        import shutil
-
         try:
-            library_dir = Path(self._lib_mgr.library_dir).resolve()
-            target = (library_dir / str(mod_name)).resolve()
-            if os.path.commonpath([str(target), str(library_dir)]) != str(
-                library_dir
-            ) or str(target) == str(library_dir):
+            library_dir = os.path.realpath(self._lib_mgr.library_dir)
+            target = os.path.realpath(os.path.join(library_dir, str(mod_name)))
+            # 目标必须严格位于语音包库内部（不能是库目录本身）
+            if not target.startswith(os.path.join(library_dir, "")):
                 raise Exception("非法路径")
             shutil.rmtree(target)
             log.info(f"已删除语音包: {mod_name}")
@@ -1005,13 +1108,11 @@ class AppApi:
                 # 还原成功，清除状态
                 self._cfg_mgr.set_current_mod("")
                 if self._window:
-                    self._window.evaluate_js("app.onRestoreSuccess()")
+                    self._push_ui("onRestoreSuccess")
             finally:
                 self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        self._submit(_run)
         return True
 
     def clear_logs(self):
@@ -1036,34 +1137,54 @@ class AppApi:
     def get_theme_list(self):
         # 扫描 web/themes 目录下的主题 JSON 文件列表，并返回主题元信息供前端下拉框展示。
         themes_dir = WEB_DIR / "themes"
-        if not themes_dir.exists():
+        try:
+            entries = list(os.scandir(themes_dir))
+        except OSError:
             return []
 
         theme_list = []
-        # 遍历 json 文件
-        for file in themes_dir.glob("*.json"):
+        seen = set()
+        # 遍历 json 文件：scandir 一次取得 mtime，仅对新增或修改过的主题重新解析
+        for entry in entries:
+            if not entry.name.lower().endswith(".json"):
+                continue
             try:
-                data = self._load_json_with_fallback(file)
-                if isinstance(data, dict):
-                    meta = data.get("meta", {})
-                    theme_list.append(
-                        {
-                            "filename": file.name,
-                            "name": meta.get("name", file.stem),
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                seen.add(entry.name)
+                cached = self._theme_cache.get(entry.name)
+                if cached and cached[0] == mtime:
+                    info = cached[1]
+                else:
+                    info = None
+                    data = self._load_json_with_fallback(entry.path)
+                    if isinstance(data, dict):
+                        meta = data.get("meta", {})
+                        info = {
+                            "filename": entry.name,
+                            "name": meta.get("name", os.path.splitext(entry.name)[0]),
                             "author": meta.get("author", "Unknown"),
                             "version": meta.get("version", "1.0"),
                         }
-                    )
+                    self._theme_cache[entry.name] = (mtime, info)
+                if info:
+                    theme_list.append(dict(info))
             except Exception as e:
-                log.error(f"读取主题 {file.name} 失败: {e}")
-        
+                log.error(f"读取主题 {entry.name} 失败: {e}")
+
+        # 清理已删除主题的缓存
+        for name in list(self._theme_cache):
+            if name not in seen:
+                del self._theme_cache[name]
+
         return theme_list
 
     def load_theme_content(self, filename):
         # 读取指定主题文件的完整 JSON 内容并返回给前端应用。
-        themes_dir = (WEB_DIR / "themes").resolve()
-        theme_path = (themes_dir / str(filename)).resolve()
-        if os.path.commonpath([str(theme_path), str(themes_dir)]) != str(themes_dir):
+        themes_dir = os.path.realpath(WEB_DIR / "themes")
+        theme_path = Path(os.path.realpath(os.path.join(themes_dir, str(filename))))
+        if not str(theme_path).startswith(os.path.join(themes_dir, "")):
             return None
         if theme_path.suffix.lower() != ".json":
             return None
@@ -1187,10 +1308,7 @@ class AppApi:
         self._is_busy = True
 
         if self._window:
-            msg_js = json.dumps(f"炮镜解压: {Path(zip_path).name}", ensure_ascii=False)
-            self._window.evaluate_js(
-                f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
-            )
+            self._show_loading_ui(f"炮镜解压: {Path(zip_path).name}")
 
         def _run():
             try:
@@ -1198,31 +1316,20 @@ class AppApi:
                     zip_path, progress_callback=self.update_loading_ui
                 )
                 if self._window:
-                    self._window.evaluate_js("if(app.refreshSights) app.refreshSights()")
-                    msg_js = json.dumps("炮镜导入完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_ui("refreshSights")
+                    self.update_loading_ui(100, "炮镜导入完成")
             except FileExistsError as e:
                 log.warning(f"{e}")
                 if self._window:
-                    msg_js = json.dumps(str(e), ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self.update_loading_ui(100, str(e))
             except Exception as e:
                 log.error(f"炮镜导入失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("炮镜导入失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self.update_loading_ui(100, "炮镜导入失败")
             finally:
                 self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._submit(_run)
         return True
 
     def open_sights_folder(self):
@@ -1251,7 +1358,7 @@ class AppApi:
         """打开目录选择对话框，选择待解压区目录。"""
         folder = self._window.create_file_dialog(webview.FileDialog.FOLDER)
         if folder and len(folder) > 0:
-            path = folder[0].replace(os.sep, "/")
+            path = Path(folder[0]).as_posix()
             return {"success": True, "path": path}
         return {"success": False}
 
@@ -1259,7 +1366,7 @@ class AppApi:
         """打开目录选择对话框，选择语音包库目录。"""
         folder = self._window.create_file_dialog(webview.FileDialog.FOLDER)
         if folder and len(folder) > 0:
-            path = folder[0].replace(os.sep, "/")
+            path = Path(folder[0]).as_posix()
             return {"success": True, "path": path}
         return {"success": False}
 
@@ -1333,6 +1440,16 @@ class AppApi:
         """打开语音包库目录。"""
         self._lib_mgr.open_library_folder()
 
+    def shutdown(self):
+        """窗口关闭后释放后台资源。"""
+        # 唤醒可能仍在等待密码输入的解压任务，并丢弃尚未开始的后台任务
+        self.cancel_archive_password()
+        self._worker_pool.shutdown(wait=False, cancel_futures=True)
+        try:
+            self._logic.shutdown()
+        except Exception:
+            log.debug("释放核心服务线程池失败", exc_info=True)
+
 
 def on_app_started():
     # 在窗口创建完成后执行启动后处理，包括关闭 PyInstaller 启动图并让前端进入可交互状态。
@@ -1540,9 +1657,7 @@ def main() -> int:
                 return
 
             for zp in zip_files[:1]:
-                th = threading.Thread(target=api.import_skin_zip_from_path, args=(zp,))
-                th.daemon = True
-                th.start()
+                api._submit(api.import_skin_zip_from_path, zp)
 
         try:
             win.dom.document.events.drop += DOMEventHandler(on_drop, True, True)
@@ -1580,7 +1695,8 @@ def main() -> int:
             gui="edgechromium",
             icon=icon_path,
         )
-        return 0
+        api.shutdown()
+        _exit_process(0)
     except Exception as e:
         log.error(f"Edge Chromium 启动失败，尝试默认模式: {e}")
 
@@ -1602,7 +1718,8 @@ def main() -> int:
         try:
             # 降级启动
             webview.start(_on_start, window, debug=False, http_server=False, icon=icon_path)
-            return 0
+            api.shutdown()
+            _exit_process(0)
         except Exception as e2:
             log.exception("webview 启动失败（含降级）")
             _show_fatal_error("启动失败", f"webview 启动失败：{e2}\n\n详见 logs/app.log")
@@ -13,7 +13,7 @@
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable
 from logger import get_logger
 
 log = get_logger(__name__)
@@ -129,29 +129,31 @@ class ManifestManager:
             log.warning(f"无法保存清单文件: {type(e).__name__}: {e}")
             return False
     
-    def check_conflicts(self, mod_name: str, files_to_install: list[str]) -> list[dict[str, str]]:
+    def check_conflicts(self, mod_name: str, files_to_install: Iterable[str]) -> list[dict[str, str]]:
         """
-        对待安装文件名列表进行所有权查询，返回与当前安装目标不一致的佔用记录。
+        对待安装文件名集合进行所有权查询，返回与当前安装目标不一致的佔用记录。
         
         Args:
             mod_name: 待安装的语音包名称
-            files_to_install: 待安装的文件名列表
+            files_to_install: 待安装的文件名集合（或任意可迭代对象）
             
         Returns:
-            冲突记录列表，每项包含 file, existing_mod, new_mod
+            冲突记录列表（按文件名排序），每项包含 file, existing_mod, new_mod
         """
         conflicts = []
         file_map = self.manifest.get("file_map", {})
+        if not isinstance(files_to_install, (set, frozenset)):
+            files_to_install = set(files_to_install)
         
-        for file_name in files_to_install:
-            if file_name in file_map:
-                existing_mod = file_map[file_name]
-                if existing_mod != mod_name:
-                    conflicts.append({
-                        "file": file_name,
-                        "existing_mod": existing_mod,
-                        "new_mod": mod_name
-                    })
+        # 以哈希交集取出已被记录的文件名，无需逐个做成员判断
+        for file_name in sorted(file_map.keys() & files_to_install):
+            existing_mod = file_map[file_name]
+            if existing_mod != mod_name:
+                conflicts.append({
+                    "file": file_name,
+                    "existing_mod": existing_mod,
+                    "new_mod": mod_name
+                })
         
         if conflicts:
             log.info(f"检测到 {len(conflicts)} 个文件冲突")
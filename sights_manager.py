@@ -24,6 +24,7 @@
 import base64
 import os
 import platform
+import re
 import shutil
 import subprocess
 import zipfile
@@ -380,7 +381,6 @@ class SightsManager:
             FileExistsError: 目标名称已存在
             OSError: 重命名操作失败
         """
-        import re
         usersights_dir = self._usersights_path
         if not usersights_dir or not usersights_dir.exists():
             raise ValueError("UserSights 路径未设置或不存在")
@@ -587,14 +587,10 @@ class SightsManager:
         except OSError as e:
             raise SightsImportError(f"无法创建临时目录: {e}")
 
-        def _is_within(base_dir: Path, target: Path) -> bool:
-            """判断目标路径是否位于指定基准目录内部。"""
-            try:
-                base = base_dir.resolve()
-                t = target.resolve()
-                return base == t or str(t).startswith(str(base) + os.sep)
-            except (OSError, ValueError):
-                return False
+        # 临时目录只解析一次；成员路径只做字符串规范化与前缀比较，不逐个 resolve
+        tmp_root = os.path.realpath(tmp_dir)
+        tmp_prefix = os.path.join(tmp_root, "")
+        created_dirs = {tmp_root}
 
         target_dir: Path | None = None
         
@@ -615,17 +611,21 @@ class SightsManager:
                         if filename.endswith("/"):
                             continue
 
-                        ext = Path(filename).suffix.lower()
+                        ext = os.path.splitext(filename)[1].lower()
                         if ext in blocked_ext:
                             raise SightsImportError(f"检测到不允许的文件类型: {filename}")
 
-                        target_path = tmp_dir / filename
-                        if not _is_within(tmp_dir, target_path):
+                        full_target_path = os.path.normpath(os.path.join(tmp_root, filename))
+                        if not full_target_path.startswith(tmp_prefix):
                             raise SightsImportError(f"压缩包路径不安全（路径遍历）: {filename}")
 
                         try:
-                            target_path.parent.mkdir(parents=True, exist_ok=True)
-                            with zf.open(m, "r") as src, open(target_path, "wb") as dst:
+                            # 同一目录只创建一次
+                            parent = os.path.dirname(full_target_path)
+                            if parent not in created_dirs:
+                                os.makedirs(parent, exist_ok=True)
+                                created_dirs.add(parent)
+                            with zf.open(m, "r") as src, open(full_target_path, "wb") as dst:
                                 shutil.copyfileobj(src, dst, length=1024 * 1024)
                         except PermissionError as e:
                             raise SightsImportError(f"解压失败（权限不足）: {filename}: {e}")
@@ -635,7 +635,7 @@ class SightsManager:
                         extracted += 1
                         if progress_callback:
                             pct = 2 + int((extracted / total) * 90)
-                            progress_callback(pct, f"解压中: {Path(filename).name}")
+                            progress_callback(pct, f"解压中: {os.path.basename(filename)}")
                             
             except zipfile.BadZipFile as e:
                 raise SightsImportError(f"无效的 ZIP 文件: {e}")
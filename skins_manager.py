@@ -22,6 +22,7 @@ import re
 import shutil
 import time
 import zipfile
+from collections import deque
 from pathlib import Path
 from typing import Callable, Any
 
@@ -29,6 +30,14 @@ from logger import get_logger
 
 log = get_logger(__name__)
 
+# 解压时单次读写的块大小 (1MB)，减少大文件的读写次数与小块分配
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# ZIP 通用标志位 bit 11：文件名已按 UTF-8 编码，zipfile 会直接正确解码
+_ZIP_FLAG_UTF8 = 0x800
+# 未声明 UTF-8 的文件名依次尝试的编码
+_ZIP_NAME_CODECS = ("utf-8", "gbk")
+
 
 class SkinsManagerError(Exception):
     """涂装管理器相关错误的基类。"""
@@ -416,17 +425,24 @@ class SkinsManager:
         """
         total = 0
         count = 0
-        try:
-            for root, _dirs, files in os.walk(dir_path):
-                for f in files:
-                    fp = Path(root) / f
-                    try:
-                        total += fp.stat().st_size
-                    except (OSError, PermissionError):
-                        pass
-                    count += 1
-        except (OSError, PermissionError) as e:
-            log.warning(f"统计目录大小失败 {dir_path}: {e}")
+        pending = deque([str(dir_path)])
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir():
+                                # 与 os.walk 一致：不进入指向目录的符号链接
+                                if not entry.is_symlink():
+                                    pending.append(entry.path)
+                                continue
+                            total += entry.stat().st_size
+                        except OSError:
+                            pass
+                        count += 1
+            except OSError as e:
+                log.warning(f"统计目录大小失败 {current}: {e}")
         return total, count
 
     def _find_preview_image(self, dir_path: Path) -> Path | None:
@@ -523,7 +539,11 @@ class SkinsManager:
         Raises:
             SkinsImportError: 解压过程失败
         """
-        target_root = Path(target_dir).resolve()
+        # 目标根目录只解析一次；成员路径只做字符串规范化与前缀比较，不访问文件系统
+        target_root = os.path.normpath(str(Path(target_dir).resolve()))
+        target_prefix = os.path.join(target_root, "")
+        created_dirs = set()
+        rejected = []  # 越界的成员文件名，解压结束后合併为一条日誌
         
         try:
             with zipfile.ZipFile(zip_path, "r") as zf:
@@ -531,40 +551,25 @@ class SkinsManager:
                 total_files = len(file_list)
                 last_update = 0.0
                 extracted_bytes = 0
-                total_bytes = 0
-
-                if total_files > 0:
-                    for m in file_list:
-                        if m.is_dir():
-                            continue
-                        name = m.filename
-                        if "__MACOSX" in name or "desktop.ini" in name:
-                            continue
-                        try:
-                            total_bytes += int(getattr(m, "file_size", 0) or 0)
-                        except (ValueError, TypeError):
-                            pass
+                # 中央目录已给出各成员大小，直接求和即可
+                total_bytes = sum(
+                    m.file_size for m in file_list
+                    if not m.is_dir() and "__MACOSX" not in m.filename and "desktop.ini" not in m.filename
+                )
 
                 for idx, member in enumerate(file_list):
-                    if idx % 50 == 0:
-                        time.sleep(0.001)
+                    # macOS 资源分叉与 desktop.ini 均为 ASCII，在原始文件名上过滤，跳过的成员无需解码
+                    raw_name = member.filename
+                    if "__MACOSX" in raw_name or "desktop.ini" in raw_name:
+                        continue
 
                     # 处理文件名编码
-                    try:
-                        filename = member.filename.encode("cp437").decode("utf-8")
-                    except (UnicodeDecodeError, UnicodeEncodeError):
-                        try:
-                            filename = member.filename.encode("cp437").decode("gbk")
-                        except (UnicodeDecodeError, UnicodeEncodeError):
-                            filename = member.filename
-
-                    if "__MACOSX" in filename or "desktop.ini" in filename:
-                        continue
+                    filename = self._decode_zip_filename(member)
 
-                    # 更新进度
-                    now = time.monotonic()
-                    should_push = (idx == 0) or (idx % 10 == 0) or (idx == total_files - 1)
-                    if progress_callback and total_files > 0 and should_push and (now - last_update) >= 0.05:
+                    # 更新进度：先按成员序号筛选，只在需要推送时读取时钟
+                    should_push = progress_callback and ((idx % 10 == 0) or (idx == total_files - 1))
+                    now = time.monotonic() if should_push else 0.0
+                    if should_push and (now - last_update) >= 0.05:
                         ratio = idx / total_files
                         current_percent = base_progress + ratio * share_progress
                         fname = filename
@@ -577,28 +582,29 @@ class SkinsManager:
                         last_update = now
 
                     # 路径安全校验
-                    full_target_path = (target_dir / filename).resolve()
-                    try:
-                        is_inside = os.path.commonpath([str(full_target_path), str(target_root)]) == str(target_root)
-                    except ValueError:
-                        is_inside = False
-                    if not is_inside:
-                        log.warning(f"拦截恶意路径穿越文件: {filename}")
+                    full_target_path = os.path.normpath(os.path.join(target_root, filename))
+                    if full_target_path != target_root and not full_target_path.startswith(target_prefix):
+                        rejected.append(filename)
                         continue
 
-                    target_path = target_dir / filename
                     if member.is_dir():
-                        try:
-                            target_path.mkdir(parents=True, exist_ok=True)
-                        except OSError as e:
-                            log.warning(f"创建目录失败 {filename}: {e}")
+                        if full_target_path not in created_dirs:
+                            try:
+                                os.makedirs(full_target_path, exist_ok=True)
+                                created_dirs.add(full_target_path)
+                            except OSError as e:
+                                log.warning(f"创建目录失败 {filename}: {e}")
                         continue
 
                     try:
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        with zf.open(member) as source, open(target_path, "wb") as target:
+                        # 同一目录只创建一次
+                        parent = os.path.dirname(full_target_path)
+                        if parent not in created_dirs:
+                            os.makedirs(parent, exist_ok=True)
+                            created_dirs.add(parent)
+                        with zf.open(member) as source, open(full_target_path, "wb") as target:
                             while True:
-                                chunk = source.read(8192)
+                                chunk = source.read(_COPY_BUFFER_SIZE)
                                 if not chunk:
                                     break
                                 target.write(chunk)
@@ -624,12 +630,44 @@ class SkinsManager:
                         raise SkinsImportError(f"解压文件失败（权限不足）: {filename}: {e}")
                     except OSError as e:
                         raise SkinsImportError(f"解压文件失败: {filename}: {e}")
+
+                if rejected:
+                    shown = ", ".join(rejected[:10])
+                    more = f" 等 {len(rejected)} 个" if len(rejected) > 10 else ""
+                    log.warning(f"拦截恶意路径穿越文件: {shown}{more}")
                         
         except zipfile.BadZipFile as e:
             raise SkinsImportError(f"无效的 ZIP 文件: {e}")
         except zipfile.LargeZipFile as e:
             raise SkinsImportError(f"ZIP 文件过大: {e}")
 
+    def _decode_zip_filename(self, member: zipfile.ZipInfo) -> str:
+        """
+        还原 ZIP 成员的原始文件名。
+        
+        已声明 UTF-8 的成员直接使用 zipfile 的解码结果；其余成员按 cp437 还原字节后
+        依次尝试 _ZIP_NAME_CODECS，均失败时保留原文件名。
+        
+        Args:
+            member: ZIP 成员信息
+            
+        Returns:
+            解码后的文件名
+        """
+        name = member.filename
+        if member.flag_bits & _ZIP_FLAG_UTF8 or name.isascii():
+            return name
+        try:
+            raw = name.encode("cp437")
+        except UnicodeEncodeError:
+            return name
+        for codec in _ZIP_NAME_CODECS:
+            try:
+                return raw.decode(codec)
+            except UnicodeDecodeError:
+                continue
+        return name
+
     def _move_tree(self, src: Path, dst: Path) -> None:
         """
         将文件或目录从 src 移动到 dst，并在目标已存在时做合併式移动。
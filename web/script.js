@@ -1403,6 +1403,36 @@ const app = {
         container.scrollTop = container.scrollHeight; // 自动滚动到底部
     },
 
+    // 被 Python 调用：批量处理后端合并推送的事件 [[fn, args], ...]
+    _drainLogs(events) {
+        const handlers = {
+            'appendLog': (...a) => this.appendLog(...a),
+            'notifyToast': (...a) => this.notifyToast(...a),
+            'updateSearchLog': (...a) => this.updateSearchLog(...a),
+            'loading.show': (...a) => window.MinimalistLoading && MinimalistLoading.show(...a),
+            'loading.update': (...a) => window.MinimalistLoading && MinimalistLoading.update(...a),
+            'loading.hide': () => window.MinimalistLoading && MinimalistLoading.hide(),
+            // 任务完成类回调与进度同队列推送，保证在之前的进度/加载事件之后执行
+            'onSearchSuccess': (...a) => this.onSearchSuccess(...a),
+            'onSearchFail': () => this.onSearchFail(),
+            'openArchivePasswordModal': (...a) => this.openArchivePasswordModal(...a),
+            'refreshLibrary': () => this.refreshLibrary(),
+            'refreshSkins': () => this.refreshSkins && this.refreshSkins(),
+            'refreshSights': () => this.refreshSights && this.refreshSights(),
+            'onInstallSuccess': (...a) => this.onInstallSuccess && this.onInstallSuccess(...a),
+            'onRestoreSuccess': () => this.onRestoreSuccess(),
+        };
+        for (const [fn, args] of events || []) {
+            const handler = handlers[fn];
+            if (!handler) continue;
+            try {
+                handler(...(args || []));
+            } catch (e) {
+                console.error('_drainLogs failed:', fn, e);
+            }
+        }
+    },
+
     updateSearchLog(msg) {
         // 更新最后一行而不是追加
         const container = document.getElementById('log-container');
@@ -1532,7 +1562,7 @@ const app = {
         div.className = 'card mod-card';
         div.dataset.id = mod.id; // 添加 ID 标识，方便动画定位
 
-        const imgUrl = mod.cover_url || '';
+        const imgUrl = mod.cover_url || 'assets/card_image.png';
         let tagsHtml = '';
 
         // 标签映射优先使用 UI_CONFIG；当 UI_CONFIG 不存在时使用内置映射